@@ -5,6 +5,7 @@ Enforces configurable maximum parallel execution limit,
 queues excess tasks by risk score, and prevents deadlocks.
 """
 
+import heapq
 import logging
 import threading
 from dataclasses import dataclass, asdict
@@ -51,7 +52,10 @@ class ConcurrencyController:
         self._semaphore = threading.Semaphore(self.max_parallel)
         self._lock = threading.Lock()
         self._active_slots: dict = {}  # slot_id -> ConcurrencySlot
-        self._queue: list = []  # (risk_score, task_id) sorted by risk descending
+        # Heap of (-risk_score, insertion_seq, task_id): highest risk
+        # first, FIFO within equal risk. O(log n) insert vs. full resort.
+        self._queue: list = []
+        self._queue_seq = 0
         self._next_slot_id = 0
 
     def acquire(self, task_id: str) -> Optional[ConcurrencySlot]:
@@ -116,8 +120,8 @@ class ConcurrencyController:
             risk_score: Composite risk score for ordering.
         """
         with self._lock:
-            self._queue.append((risk_score, task_id))
-            self._queue.sort(key=lambda x: x[0], reverse=True)
+            heapq.heappush(self._queue, (-risk_score, self._queue_seq, task_id))
+            self._queue_seq += 1
 
         if self.ops_logger:
             self.ops_logger.log(
@@ -130,7 +134,7 @@ class ConcurrencyController:
         """Remove and return the highest-risk task from the queue."""
         with self._lock:
             if self._queue:
-                _, task_id = self._queue.pop(0)
+                _, _, task_id = heapq.heappop(self._queue)
                 return task_id
         return None
 
@@ -142,7 +146,7 @@ class ConcurrencyController:
     def get_queued(self) -> list:
         """Return queued tasks in risk-score order."""
         with self._lock:
-            return [(tid, score) for score, tid in self._queue]
+            return [(tid, -neg_score) for neg_score, _, tid in sorted(self._queue)]
 
     def check_timeouts(self) -> list:
         """
@@ -172,7 +176,7 @@ class ConcurrencyController:
 
     def _get_queue_position(self, task_id: str) -> int:
         """Get 1-based position of task in queue."""
-        for i, (_, tid) in enumerate(self._queue):
+        for i, (_, _, tid) in enumerate(sorted(self._queue)):
             if tid == task_id:
                 return i + 1
         return -1
@@ -5,13 +5,19 @@ Represents a task's execution plan as a directed acyclic graph (DAG)
 with ordered steps, dependency edges, and parallelizable groups.
 """
 
-import json
+import heapq
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from typing import Optional
 
+from utils.json_io import dumps_indent, loads
 
-@dataclass
+
+# slots=True stores fields at fixed offsets instead of a per-instance
+# __dict__ — less memory and faster attribute access for graphs with
+# many steps. Steps stay unfrozen: self-healing and the tests flip
+# status in place, with graph.version bumps invalidating the caches.
+@dataclass(slots=True)
 class ExecutionStep:
     """A single step in an execution graph."""
 
@@ -49,6 +55,11 @@ class ExecutionGraph:
     def __post_init__(self):
         if not self.created_at:
             self.created_at = datetime.now().isoformat()
+        # Results memoized against version: callers that poll the order
+        # or re-validate an unchanged graph pay the O(V+E) walk once.
+        # Mutators must bump version for the caches to refresh.
+        self._order_cache = None
+        self._validated_version = None
 
     def validate(self) -> bool:
         """
@@ -59,12 +70,18 @@ class ExecutionGraph:
         - All step_ids in edges exist in steps
         - No circular dependencies (DAG property)
 
+        The result is cached per version; re-validating an unchanged
+        graph is O(1).
+
         Returns:
             True if valid.
 
         Raises:
             ValueError: If validation fails.
         """
+        if self._validated_version == self.version:
+            return True
+
         if not self.steps:
             raise ValueError("ExecutionGraph must have at least 1 step")
 
@@ -97,35 +114,57 @@ class ExecutionGraph:
         if visited != len(self.steps):
             raise ValueError("ExecutionGraph contains circular dependencies")
 
+        self._validated_version = self.version
         return True
 
     def get_execution_order(self) -> list:
         """
         Return steps in topological order (respecting dependencies).
 
+        Kahn's BFS with a priority heap over the ready set: among steps
+        whose dependencies are satisfied, lowest priority value runs
+        first, with insertion order breaking ties. Graphs with no edges
+        skip straight to a single priority sort.
+
+        The order is cached per version; repeated calls on an
+        unchanged graph return the same list without re-sorting.
+
         Returns:
             List of ExecutionStep in execution order.
         """
+        if self._order_cache is not None and self._order_cache[0] == self.version:
+            return self._order_cache[1]
+
+        # Fast path: no dependencies, priority sort alone gives the order
+        if not self.edges:
+            result = sorted(self.steps, key=lambda s: s.priority)
+            self._order_cache = (self.version, result)
+            return result
+
         step_map = {s.step_id: s for s in self.steps}
         in_degree = {s.step_id: 0 for s in self.steps}
         for src, dsts in self.edges.items():
             for dst in dsts:
                 in_degree[dst] = in_degree.get(dst, 0) + 1
 
-        queue = sorted(
-            [sid for sid, deg in in_degree.items() if deg == 0],
-            key=lambda sid: step_map[sid].priority
-        )
+        ready = []
+        seq = 0
+        for sid, deg in in_degree.items():
+            if deg == 0:
+                heapq.heappush(ready, (step_map[sid].priority, seq, sid))
+                seq += 1
+
         result = []
-        while queue:
-            node = queue.pop(0)
+        while ready:
+            _, _, node = heapq.heappop(ready)
             result.append(step_map[node])
             for dst in self.edges.get(node, []):
                 in_degree[dst] -= 1
                 if in_degree[dst] == 0:
-                    queue.append(dst)
-            queue.sort(key=lambda sid: step_map[sid].priority)
+                    heapq.heappush(ready, (step_map[dst].priority, seq, dst))
+                    seq += 1
 
+        self._order_cache = (self.version, result)
         return result
 
     def to_json(self) -> str:
@@ -138,12 +177,12 @@ class ExecutionGraph:
             "created_at": self.created_at,
             "version": self.version,
         }
-        return json.dumps(data, indent=2)
+        return dumps_indent(data).decode('utf-8')
 
     @classmethod
     def from_json(cls, json_str: str) -> "ExecutionGraph":
         """Reconstruct an ExecutionGraph from a JSON string."""
-        data = json.loads(json_str)
+        data = loads(json_str)
         steps = [ExecutionStep(**s) for s in data["steps"]]
         return cls(
             task_id=data["task_id"],
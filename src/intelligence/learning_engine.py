@@ -5,16 +5,42 @@ Tracks execution metrics per task type and provides historical
 insights to improve planning, risk scoring, and SLA prediction.
 """
 
-import json
 import logging
 import math
+import os
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
+from utils.json_io import dumps_indent, dumps_line, loads
+
+# NumPy is optional and only pays off when maintenance recomputes
+# aggregates over a large surviving record set, so the import is
+# deferred to first use.
+np = None
+_np_checked = False
+
+
+def _load_numpy():
+    """Import numpy on first demand; returns None when unavailable."""
+    global np, _np_checked
+    if not _np_checked:
+        _np_checked = True
+        try:
+            import numpy
+            np = numpy
+        except ImportError:  # Optional — scalar path is used without it
+            np = None
+    return np
+
+
 logger = logging.getLogger(__name__)
 
+# Record sets at or below this size stay on the scalar path, where
+# NumPy's array setup overhead outweighs the vectorized arithmetic.
+_VECTORIZE_THRESHOLD = 64
+
 
 @dataclass
 class LearningMetrics:
@@ -75,6 +101,45 @@ class LearningEngine:
         self.config = config
         self.retention_days = config.get("learning_window_days", 30)
         self.ops_logger = ops_logger
+        # Parsed LearningMetrics per task type; record() and
+        # maintenance() keep entries current, so repeat queries skip
+        # the meta.json open + parse. Unseen/unreadable types are not
+        # cached, so a type's first successful read always hits disk.
+        self._metrics_cache: dict = {}
+        # Persistent O_APPEND fd per task type, opened on first record.
+        # Appends become one atomic write syscall each, as in
+        # OperationsLogger; task types are few so the dict stays tiny.
+        self._fds: dict = {}
+
+    def _append(self, task_type: str, data: bytes) -> None:
+        """Append raw bytes to <task_type>.jsonl via its cached fd,
+        reopening once if the fd went stale."""
+        fd = self._fds.get(task_type)
+        if fd is None:
+            fd = os.open(str(self.learning_dir / f"{task_type}.jsonl"),
+                         os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            self._fds[task_type] = fd
+        try:
+            os.write(fd, data)
+        except OSError:
+            os.close(fd)
+            fd = os.open(str(self.learning_dir / f"{task_type}.jsonl"),
+                         os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            self._fds[task_type] = fd
+            os.write(fd, data)
+
+    def close(self) -> None:
+        """Close any cached append fds."""
+        fds, self._fds = self._fds, {}
+        for fd in fds.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def __del__(self):
+        if getattr(self, '_fds', None):
+            self.close()
 
     def record(self, task_result: dict) -> bool:
         """
@@ -100,12 +165,10 @@ class LearningEngine:
 
         try:
             # Append raw record
-            jsonl_path = self.learning_dir / f"{task_type}.jsonl"
-            with open(jsonl_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(record) + "\n")
+            self._append(task_type, dumps_line(record))
 
             # Update aggregates
-            self._update_aggregates(task_type, record)
+            self._update_aggregates(task_type, [record])
 
             # Log
             self._log_update(task_type)
@@ -114,125 +177,211 @@ class LearningEngine:
             logger.error(f"Failed to record learning data: {e}")
             return False
 
+    def record_many(self, task_results: list) -> bool:
+        """
+        Persist a batch of execution outcomes with one write per task type.
+
+        Groups records by task_type, appends each type's JSONL file once,
+        folds all aggregate updates in memory, and rewrites each
+        .meta.json once per batch instead of once per record.
+
+        Args:
+            task_results: List of dicts in the same shape record() takes.
+
+        Returns:
+            True if every record was persisted successfully.
+        """
+        ts = datetime.now().isoformat()
+        by_type = {}
+        for task_result in task_results:
+            task_type = task_result.get("task_type", "general")
+            by_type.setdefault(task_type, []).append({
+                "ts": ts,
+                "task_type": task_type,
+                "duration_ms": task_result.get("duration_ms", 0),
+                "outcome": task_result.get("outcome", "success"),
+                "retry_count": task_result.get("retry_count", 0),
+                "retry_succeeded": task_result.get("retry_succeeded", False),
+                "sla_breached": task_result.get("sla_breached", False),
+            })
+
+        ok = True
+        for task_type, records in by_type.items():
+            try:
+                self._append(task_type,
+                             b"".join(dumps_line(r) for r in records))
+
+                self._update_aggregates(task_type, records)
+                self._log_update(task_type)
+            except Exception as e:
+                logger.error(f"Failed to record learning batch for {task_type}: {e}")
+                ok = False
+        return ok
+
     def query(self, task_type: str) -> Optional[LearningMetrics]:
         """
         Retrieve aggregated metrics for a task type.
 
         Returns:
-            LearningMetrics or None if no data exists.
+            LearningMetrics or None if no data exists. The returned
+            object is the engine's live aggregate; later record() calls
+            update it in place.
         """
+        cached = self._metrics_cache.get(task_type)
+        if cached is not None:
+            return cached
+
         meta_path = self.learning_dir / f"{task_type}.meta.json"
         if not meta_path.exists():
             return None
 
         try:
-            data = json.loads(meta_path.read_text(encoding="utf-8"))
-            return LearningMetrics(**{k: v for k, v in data.items()
-                                     if k in LearningMetrics.__dataclass_fields__})
+            data = loads(meta_path.read_bytes())
+            metrics = LearningMetrics(**{k: v for k, v in data.items()
+                                        if k in LearningMetrics.__dataclass_fields__})
+            self._metrics_cache[task_type] = metrics
+            return metrics
         except Exception as e:
             logger.error(f"Failed to read learning data for {task_type}: {e}")
             return None
 
     def maintenance(self):
-        """Purge records older than retention window and recompute aggregates."""
+        """Purge records older than retention window and recompute aggregates.
+
+        Each .jsonl is streamed line by line with survivors written to
+        a sibling temp file that atomically replaces the original, so
+        the rewrite is constant-memory and a crash mid-purge cannot
+        leave a truncated log. Files with nothing to drop are left
+        untouched (their aggregates are already current).
+        """
         cutoff = datetime.now() - timedelta(days=self.retention_days)
 
         for jsonl_path in self.learning_dir.glob("*.jsonl"):
             task_type = jsonl_path.stem
+            tmp_path = jsonl_path.with_suffix(".jsonl.tmp")
             try:
-                lines = jsonl_path.read_text(encoding="utf-8").strip().split("\n")
-                kept = []
-                for line in lines:
-                    if not line.strip():
-                        continue
-                    try:
-                        record = json.loads(line)
-                        ts = datetime.fromisoformat(record["ts"])
+                survivors = []
+                dropped = False
+                with open(jsonl_path, "rb") as src, \
+                        open(tmp_path, "wb") as tmp:
+                    for line in src:
+                        stripped = line.strip()
+                        if not stripped:
+                            dropped = True
+                            continue
+                        try:
+                            record = loads(stripped)
+                            ts = datetime.fromisoformat(record["ts"])
+                        except (KeyError, ValueError):
+                            dropped = True
+                            continue
                         if ts >= cutoff:
-                            kept.append(line)
-                    except (json.JSONDecodeError, KeyError, ValueError):
-                        continue
+                            survivors.append(record)
+                            tmp.write(stripped + b"\n")
+                        else:
+                            dropped = True
+
+                if not dropped:
+                    tmp_path.unlink()
+                    continue
 
-                jsonl_path.write_text("\n".join(kept) + "\n" if kept else "",
-                                     encoding="utf-8")
+                os.replace(tmp_path, jsonl_path)
+
+                # The replace swapped in a new inode; drop the cached
+                # append fd so the next record reopens the live file.
+                fd = self._fds.pop(task_type, None)
+                if fd is not None:
+                    try:
+                        os.close(fd)
+                    except OSError:
+                        pass
 
                 # Recompute aggregates from remaining data
-                self._recompute_aggregates(task_type, kept)
+                self._recompute_aggregates(task_type, survivors)
             except Exception as e:
                 logger.error(f"Maintenance error for {task_type}: {e}")
+                tmp_path.unlink(missing_ok=True)
 
-    def _update_aggregates(self, task_type: str, record: dict):
-        """Incrementally update aggregates using Welford's algorithm."""
+    def _update_aggregates(self, task_type: str, records: list):
+        """
+        Fold records into the aggregates using Welford's algorithm.
+
+        Reads the current metrics once, applies every record in memory,
+        then writes .meta.json a single time.
+        """
         metrics = self.query(task_type) or LearningMetrics(task_type=task_type)
 
-        n = metrics.total_count + 1
-        duration = record.get("duration_ms", 0)
+        for record in records:
+            n = metrics.total_count + 1
+            duration = record.get("duration_ms", 0)
 
-        # Welford's online algorithm for mean and variance
-        old_mean = metrics.avg_duration_ms
-        new_mean = old_mean + (duration - old_mean) / n
-        new_variance = (
-            metrics.duration_variance * (n - 1) + (duration - old_mean) * (duration - new_mean)
-        ) / n if n > 1 else 0.0
+            # Welford's online algorithm for mean and variance
+            old_mean = metrics.avg_duration_ms
+            new_mean = old_mean + (duration - old_mean) / n
+            new_variance = (
+                metrics.duration_variance * (n - 1) + (duration - old_mean) * (duration - new_mean)
+            ) / n if n > 1 else 0.0
 
-        metrics.total_count = n
-        metrics.avg_duration_ms = new_mean
-        metrics.duration_variance = new_variance
+            metrics.total_count = n
+            metrics.avg_duration_ms = new_mean
+            metrics.duration_variance = new_variance
 
-        if record.get("outcome") == "success":
-            metrics.success_count += 1
-        else:
-            metrics.failure_count += 1
+            if record.get("outcome") == "success":
+                metrics.success_count += 1
+            else:
+                metrics.failure_count += 1
 
-        if record.get("retry_count", 0) > 0:
-            metrics.retry_total_count += 1
-            if record.get("retry_succeeded", False):
-                metrics.retry_success_count += 1
+            if record.get("retry_count", 0) > 0:
+                metrics.retry_total_count += 1
+                if record.get("retry_succeeded", False):
+                    metrics.retry_success_count += 1
 
-        if record.get("sla_breached", False):
-            metrics.sla_breach_count += 1
+            if record.get("sla_breached", False):
+                metrics.sla_breach_count += 1
 
         metrics.last_updated = datetime.now().isoformat()
 
         # Write aggregates
         meta_path = self.learning_dir / f"{task_type}.meta.json"
-        meta_path.write_text(json.dumps(asdict(metrics), indent=2), encoding="utf-8")
+        meta_path.write_bytes(dumps_indent(asdict(metrics)))
+        self._metrics_cache[task_type] = metrics
 
-    def _recompute_aggregates(self, task_type: str, lines: list):
-        """Recompute aggregates from raw records after purge."""
+    def _recompute_aggregates(self, task_type: str, records: list):
+        """Recompute aggregates from parsed records after purge."""
         metrics = LearningMetrics(task_type=task_type)
 
         durations = []
-        for line in lines:
-            if not line.strip():
-                continue
-            try:
-                record = json.loads(line)
-                duration = record.get("duration_ms", 0)
-                durations.append(duration)
-                metrics.total_count += 1
-                if record.get("outcome") == "success":
-                    metrics.success_count += 1
-                else:
-                    metrics.failure_count += 1
-                if record.get("retry_count", 0) > 0:
-                    metrics.retry_total_count += 1
-                    if record.get("retry_succeeded", False):
-                        metrics.retry_success_count += 1
-                if record.get("sla_breached", False):
-                    metrics.sla_breach_count += 1
-            except (json.JSONDecodeError, KeyError):
-                continue
+        for record in records:
+            duration = record.get("duration_ms", 0)
+            durations.append(duration)
+            metrics.total_count += 1
+            if record.get("outcome") == "success":
+                metrics.success_count += 1
+            else:
+                metrics.failure_count += 1
+            if record.get("retry_count", 0) > 0:
+                metrics.retry_total_count += 1
+                if record.get("retry_succeeded", False):
+                    metrics.retry_success_count += 1
+            if record.get("sla_breached", False):
+                metrics.sla_breach_count += 1
 
         if durations:
-            mean = sum(durations) / len(durations)
-            metrics.avg_duration_ms = mean
-            if len(durations) > 1:
-                metrics.duration_variance = sum((d - mean) ** 2 for d in durations) / len(durations)
+            if (len(durations) > _VECTORIZE_THRESHOLD
+                    and _load_numpy() is not None):
+                arr = np.asarray(durations, dtype=np.float64)
+                metrics.avg_duration_ms = float(arr.mean())
+                metrics.duration_variance = float(arr.var())
+            else:
+                mean = sum(durations) / len(durations)
+                metrics.avg_duration_ms = mean
+                if len(durations) > 1:
+                    metrics.duration_variance = sum((d - mean) ** 2 for d in durations) / len(durations)
 
         metrics.last_updated = datetime.now().isoformat()
         meta_path = self.learning_dir / f"{task_type}.meta.json"
-        meta_path.write_text(json.dumps(asdict(metrics), indent=2), encoding="utf-8")
+        meta_path.write_bytes(dumps_indent(asdict(metrics)))
+        self._metrics_cache[task_type] = metrics
 
     def _log_update(self, task_type: str):
         """Log learning_update event."""
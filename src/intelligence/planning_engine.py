@@ -5,8 +5,10 @@ Converts high-level task descriptions into structured execution plans
 using keyword-based heuristic decomposition and type-based templates.
 """
 
+import functools
 import json
 import logging
+import re
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -15,6 +17,11 @@ from intelligence.execution_graph import ExecutionGraph, ExecutionStep
 
 logger = logging.getLogger(__name__)
 
+
+class EmptyTaskError(ValueError):
+    """Raised when decompose() receives empty task content."""
+
+
 # Task type templates: each maps to ordered steps with dependency info
 TASK_TEMPLATES = {
     "document": [
@@ -69,6 +76,92 @@ TYPE_KEYWORDS = {
 }
 
 
+# Flattened keyword tables compiled once at import. The lookahead
+# alternation finds every keyword occurrence in one linear pass instead
+# of one substring scan per keyword; alternatives are ordered longest
+# first, so when a keyword is a prefix of a longer one at the same
+# position (e.g. "data" / "database") only the longer is captured —
+# _KEYWORD_PREFIXES restores the masked shorter keywords.
+_KEYWORD_TO_TYPE = {kw: t for t, kws in TYPE_KEYWORDS.items() for kw in kws}
+_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(
+        re.escape(kw)
+        for kw in sorted(_KEYWORD_TO_TYPE, key=len, reverse=True)
+    ) + "))"
+)
+_KEYWORD_PREFIXES = {
+    kw: tuple(o for o in _KEYWORD_TO_TYPE if o != kw and kw.startswith(o))
+    for kw in _KEYWORD_TO_TYPE
+    if any(o != kw and kw.startswith(o) for o in _KEYWORD_TO_TYPE)
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _detect_task_type(content: str) -> str:
+    """
+    Keyword-score content against TYPE_KEYWORDS.
+
+    Pure function of the prompt text, so results are memoized — repeated
+    decompositions of the same prompt skip the keyword scan entirely.
+    """
+    found = set()
+    for m in _KEYWORD_RE.finditer(content.lower()):
+        kw = m.group(1)
+        found.add(kw)
+        found.update(_KEYWORD_PREFIXES.get(kw, ()))
+
+    # Score in TYPE_KEYWORDS declaration order so ties break the same
+    # way as the original per-type substring scan.
+    scores = {}
+    for task_type, keywords in TYPE_KEYWORDS.items():
+        score = sum(1 for kw in keywords if kw in found)
+        if score > 0:
+            scores[task_type] = score
+
+    if scores:
+        return max(scores, key=scores.get)
+    return "general"
+
+
+@functools.lru_cache(maxsize=None)
+def _template_steps(task_type: str) -> tuple:
+    """Step tuples (step_id, name, priority, alternative) per type.
+
+    The template shape never varies between decompositions, so the
+    enumerated form is built once; decompose() only materializes fresh
+    ExecutionStep objects (their status is mutable) around it.
+    """
+    template = TASK_TEMPLATES.get(task_type, TASK_TEMPLATES["general"])
+    return tuple((step_id, name, i + 1, alt_id)
+                 for i, (step_id, name, alt_id) in enumerate(template))
+
+
+@functools.lru_cache(maxsize=None)
+def _template_structure(task_type: str) -> tuple:
+    """Cached (edges, parallelizable_groups) for a template's shape.
+
+    Edges are the sequential step chain and the parallel groups are its
+    roots; both depend only on the template, so derive them once.
+    Returned as immutable tuples — decompose() materializes mutable
+    copies for each graph.
+    """
+    steps = _template_steps(task_type)
+    edges = tuple(
+        (steps[i][0], (steps[i + 1][0],))
+        for i in range(len(steps) - 1)
+    )
+
+    dependents = {dst for _, dsts in edges for dst in dsts}
+    roots = tuple(sid for sid, _, _, _ in steps if sid not in dependents)
+    parallel = (roots,) if len(roots) > 1 else ()
+    return edges, parallel
+
+
+# Task types whose template-built graph already passed validate();
+# the structure is identical on every decompose, only durations differ.
+_VALIDATED_TYPES = set()
+
+
 class PlanningEngine:
     """
     Heuristic-based task decomposition engine.
@@ -99,35 +192,33 @@ class PlanningEngine:
             ExecutionGraph with ordered steps, dependencies, and priorities.
         """
         if not task_content or not task_content.strip():
-            raise ValueError("Task content is empty")
+            raise EmptyTaskError("Task content is empty")
 
         # Detect task type
         if not task_type:
             task_type = self._extract_task_type(task_content)
 
-        # Get step templates
-        template = TASK_TEMPLATES.get(task_type, TASK_TEMPLATES["general"])
-
-        # Build steps with priorities
-        steps = []
-        for i, (step_id, name, alt_id) in enumerate(template):
-            duration = self._get_estimated_duration(task_type, step_id)
-            step = ExecutionStep(
+        # Build steps with priorities from the cached template shape.
+        # The duration estimate is a function of task type only, so
+        # compute it once instead of once per step.
+        duration = self._get_estimated_duration(task_type)
+        steps = [
+            ExecutionStep(
                 step_id=step_id,
                 name=name,
-                priority=i + 1,
+                priority=priority,
                 estimated_duration=duration,
                 alternative_step=alt_id,
             )
-            steps.append(step)
-
-        # Build dependency edges (sequential by default)
-        edges = {}
-        for i in range(len(steps) - 1):
-            edges[steps[i].step_id] = [steps[i + 1].step_id]
+            for step_id, name, priority, alt_id in _template_steps(task_type)
+        ]
 
-        # Identify parallelizable groups
-        parallelizable = self._find_parallelizable(steps, edges)
+        # Dependency edges and parallel groups are properties of the
+        # template shape; copy the cached structure into the mutable
+        # dict/list form the graph (and its serializers) expect.
+        cached_edges, cached_parallel = _template_structure(task_type)
+        edges = {src: list(dsts) for src, dsts in cached_edges}
+        parallelizable = [list(group) for group in cached_parallel]
 
         graph = ExecutionGraph(
             task_id=task_id,
@@ -135,7 +226,9 @@ class PlanningEngine:
             edges=edges,
             parallelizable_groups=parallelizable,
         )
-        graph.validate()
+        if task_type not in _VALIDATED_TYPES:
+            graph.validate()
+            _VALIDATED_TYPES.add(task_type)
 
         # Log
         self._log_decomposition(graph)
@@ -155,20 +248,20 @@ class PlanningEngine:
 
     def _extract_task_type(self, content: str) -> str:
         """Extract task type from content using keyword matching."""
-        content_lower = content.lower()
-        scores = {}
-
-        for task_type, keywords in TYPE_KEYWORDS.items():
-            score = sum(1 for kw in keywords if kw in content_lower)
-            if score > 0:
-                scores[task_type] = score
-
-        if scores:
-            return max(scores, key=scores.get)
-        return "general"
-
-    def _get_estimated_duration(self, task_type: str, step_id: str) -> float:
-        """Get estimated duration for a step, using learning data if available."""
+        return _detect_task_type(content)
+
+    @staticmethod
+    def clear_cache():
+        """Clear memoized detections and template shapes (for tests
+        that mutate keywords or templates)."""
+        _detect_task_type.cache_clear()
+        _template_steps.cache_clear()
+        _template_structure.cache_clear()
+        _VALIDATED_TYPES.clear()
+
+    def _get_estimated_duration(self, task_type: str) -> float:
+        """Get the per-step duration estimate for a task type, using
+        learning data if available."""
         default_duration = 1.0  # 1 minute default
 
         if self.learning_engine:
@@ -182,19 +275,6 @@ class PlanningEngine:
 
         return default_duration
 
-    def _find_parallelizable(self, steps: list, edges: dict) -> list:
-        """Identify groups of steps that can execute in parallel."""
-        # Steps with no incoming edges from each other are parallelizable
-        dependents = set()
-        for dsts in edges.values():
-            dependents.update(dsts)
-
-        # Root steps (no dependencies) can be parallel
-        roots = [s.step_id for s in steps if s.step_id not in dependents]
-        if len(roots) > 1:
-            return [roots]
-        return []
-
     def _log_decomposition(self, graph: ExecutionGraph):
         """Log planning engine decomposition."""
         if not self.ops_logger:
@@ -8,11 +8,12 @@ Implements a recovery cascade before Gold rollback:
 4. Fall back to Gold rollback mechanism
 """
 
+import random
 import time
 import logging
 from dataclasses import dataclass, asdict
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -53,11 +54,27 @@ class SelfHealingEngine:
     Recovery cascade: retry -> alternative -> partial -> Gold fallback
     """
 
-    def __init__(self, config: dict, rollback_manager=None, ops_logger=None):
+    def __init__(self, config: dict, rollback_manager=None, ops_logger=None,
+                 sleep_fn: Callable[[float], None] = time.sleep,
+                 rng: Optional[random.Random] = None):
         self.config = config
         self.max_attempts = config.get("max_recovery_attempts", 3)
+        # Delay before each recovery attempt; 0 (the default) disables
+        # sleeping entirely, so tests never pay wall-clock time.
+        self.retry_delay_seconds = config.get("recovery_retry_delay_seconds", 0)
+        self.retry_jitter = config.get("recovery_retry_jitter", 0.1)
         self.rollback_manager = rollback_manager
         self.ops_logger = ops_logger
+        self._sleep = sleep_fn
+        self._rng = rng or random.Random()
+
+    def _backoff(self, attempt_num: int):
+        """Sleep before a recovery attempt (exponential backoff + jitter)."""
+        if self.retry_delay_seconds <= 0:
+            return
+        delay = self.retry_delay_seconds * (2 ** (attempt_num - 1))
+        delay *= 1 + self._rng.random() * self.retry_jitter
+        self._sleep(delay)
 
     def recover(self, task_path, failed_step, execution_graph=None, execute_fn=None):
         """
@@ -79,6 +96,7 @@ class SelfHealingEngine:
         # Strategy 1: Retry
         if attempt_num < self.max_attempts:
             attempt_num += 1
+            self._backoff(attempt_num)
             attempt = self._attempt_retry(task_id, failed_step, attempt_num, execute_fn)
             attempts.append(attempt)
             self._log_attempt(attempt)
@@ -90,6 +108,7 @@ class SelfHealingEngine:
             alt_step = self._find_alternative(failed_step, execution_graph)
             if alt_step:
                 attempt_num += 1
+                self._backoff(attempt_num)
                 attempt = self._attempt_alternative(
                     task_id, failed_step, alt_step, attempt_num, execute_fn
                 )
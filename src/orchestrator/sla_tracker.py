@@ -14,6 +14,7 @@ import frontmatter
 
 from utils.config import get_config
 from utils.operations_logger import OperationsLogger
+from utils.yaml_io import YAML_HANDLER
 
 logger = logging.getLogger(__name__)
 
@@ -64,7 +65,7 @@ class SLATracker:
 
         try:
             with open(task_path, 'r', encoding='utf-8') as f:
-                post = frontmatter.load(f)
+                post = frontmatter.load(f, handler=YAML_HANDLER)
         except Exception as e:
             logger.error(f"Cannot read task for SLA check: {e}")
             return result
@@ -746,12 +746,19 @@ Output ONLY the action steps in checkbox format, nothing else:"""
             except Exception as e:
                 logger.warning(f"SLA prediction failed for {task_path.name}: {e}")
 
-    def process_all_pending(self) -> int:
+    def process_all_pending(self, return_pending: bool = False):
         """
         Process all pending tasks that don't have plans.
 
+        Args:
+            return_pending: If True, also return the pending task list
+                from the single folder scan (avoids callers re-walking
+                Needs_Action just to inspect what was pending).
+
         Returns:
-            Number of plans generated.
+            Number of plans generated, or a
+            (plans_generated, pending_tasks) tuple when return_pending
+            is True.
         """
         pending_tasks = self.read_pending_tasks()
 
@@ -810,4 +817,6 @@ Output ONLY the action steps in checkbox format, nothing else:"""
                 if slot and self.concurrency_controller:
                     self.concurrency_controller.complete(slot.slot_id)
 
+        if return_pending:
+            return plans_generated, pending_tasks
         return plans_generated
@@ -5,33 +5,68 @@ Scans vault files for credential patterns (API keys, tokens,
 passwords, PEM keys) and flags them for review.
 """
 
-import re
+import functools
 import logging
+import mmap
+import re
 from pathlib import Path
 from typing import List, Dict
 
+try:
+    import re2  # google-re2: linear-time DFA engine, no backtracking
+except ImportError:  # Optional — stdlib re is used without it
+    re2 = None
+
 logger = logging.getLogger(__name__)
 
 
-# Compiled regex patterns for credential detection
-CREDENTIAL_PATTERNS = {
-    'aws_access_key': re.compile(
-        r'(?:AKIA|ABIA|ACCA|ASIA)[0-9A-Z]{16}', re.IGNORECASE),
-    'api_token': re.compile(
+# Raw regex sources for credential detection
+_RAW_PATTERNS = {
+    'aws_access_key': r'(?:AKIA|ABIA|ACCA|ASIA)[0-9A-Z]{16}',
+    'api_token':
         r'(?:api[_-]?key|api[_-]?token|apikey)\s*[:=]\s*["\']?[\w\-]{20,}',
-        re.IGNORECASE),
-    'pem_key': re.compile(
-        r'-----BEGIN (?:RSA |EC |DSA )?PRIVATE KEY-----'),
-    'password_field': re.compile(
+    'pem_key': r'-----BEGIN (?:RSA |EC |DSA )?PRIVATE KEY-----',
+    'password_field':
         r'(?:password|passwd|pwd)\s*[:=]\s*["\']?[^\s"\']{8,}',
-        re.IGNORECASE),
-    'generic_secret': re.compile(
+    'generic_secret':
         r'(?:secret|token|bearer)\s*[:=]\s*["\']?[\w\-/.]{20,}',
-        re.IGNORECASE),
-    'connection_string': re.compile(
-        r'(?:mongodb|postgres|mysql|redis)://\S+:\S+@', re.IGNORECASE),
+    'connection_string': r'(?:mongodb|postgres|mysql|redis)://\S+:\S+@',
 }
 
+# PEM headers are uppercase by spec; everything else matches any case
+_CASE_SENSITIVE = frozenset({'pem_key'})
+
+# Compiled regex patterns for credential detection
+CREDENTIAL_PATTERNS = {
+    name: re.compile(src, 0 if name in _CASE_SENSITIVE else re.IGNORECASE)
+    for name, src in _RAW_PATTERNS.items()
+}
+
+# Single alternation over all six patterns so scan_file sweeps each file
+# once; m.lastgroup names the pattern that matched. Case-insensitivity
+# is scoped per alternative via (?i:...) to keep pem_key strict.
+_COMBINED_SRC = '|'.join(
+    f'(?P<{name}>{src})' if name in _CASE_SENSITIVE
+    else f'(?P<{name}>(?i:{src}))'
+    for name, src in _RAW_PATTERNS.items()
+)
+
+# The patterns are regular (no backreferences), so prefer re2's DFA
+# when installed: linear-time scans with no pathological backtracking.
+_COMBINED_PATTERN = re.compile(_COMBINED_SRC)
+if re2 is not None:
+    try:
+        _COMBINED_PATTERN = re2.compile(_COMBINED_SRC)
+    except re2.error:  # pragma: no cover - re2 rejects a construct
+        logger.warning("re2 rejected combined credential pattern; "
+                       "falling back to stdlib re")
+
+# Bytes twin of the combined pattern for mmap'd file scans: matching on
+# the raw buffer skips the UTF-8 decode of the whole file. Kept on
+# stdlib re, which accepts any buffer (mmap included) for bytes
+# patterns.
+_COMBINED_BYTES = re.compile(_COMBINED_SRC.encode('ascii'))
+
 
 class CredentialScanner:
     """
@@ -46,9 +81,43 @@ class CredentialScanner:
     - Connection strings with embedded credentials
     """
 
+    _SCAN_CACHE_MAX = 1024
+
     def __init__(self):
         """Initialize CredentialScanner."""
         self.patterns = CREDENTIAL_PATTERNS
+        # Findings cache keyed on (path, mtime_ns, size); a rewrite
+        # changes the key, so repeated vault sweeps only re-scan files
+        # that actually changed.
+        self._scan_cache: dict = {}
+
+    def scan_text(self, text: str, file_label: str = '') -> List[Dict]:
+        """
+        Scan already-loaded text for credential patterns.
+
+        Args:
+            text: The content to scan.
+            file_label: Label recorded in each finding's 'file' key.
+
+        Returns:
+            List of finding dicts with 'pattern', 'line', 'match' keys.
+        """
+        findings = []
+
+        # One combined-alternation sweep examines each byte of the text
+        # once; finditer yields matches in position order, so findings
+        # come out line-major without a sort.
+        for match in _COMBINED_PATTERN.finditer(text):
+            # Partially mask the match for safe logging
+            masked = self._mask_value(match.group(0))
+            findings.append({
+                'pattern': match.lastgroup,
+                'line': text.count('\n', 0, match.start()) + 1,
+                'match': masked,
+                'file': file_label,
+            })
+
+        return findings
 
     def scan_file(self, file_path: Path) -> List[Dict]:
         """
@@ -60,27 +129,53 @@ class CredentialScanner:
         Returns:
             List of finding dicts with 'pattern', 'line', 'match' keys.
         """
-        findings = []
-
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            st = file_path.stat()
+            key = (str(file_path), st.st_mtime_ns, st.st_size)
+            cached = self._scan_cache.get(key)
+            if cached is not None:
+                return cached
+
+            if st.st_size == 0:
+                findings: List[Dict] = []
+            else:
+                # mmap the file and match on the raw buffer: no whole-
+                # file decode, and the kernel pages in only what the
+                # scan touches.
+                with open(file_path, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0,
+                                  access=mmap.ACCESS_READ) as mm:
+                    findings = self._scan_buffer(mm, str(file_path))
         except Exception as e:
             logger.error(f"Cannot read file for scanning: {file_path}: {e}")
-            return findings
-
-        for line_num, line in enumerate(content.split('\n'), 1):
-            for pattern_name, pattern in self.patterns.items():
-                matches = pattern.findall(line)
-                if matches:
-                    for match in matches:
-                        # Partially mask the match for safe logging
-                        masked = self._mask_value(str(match))
-                        findings.append({
-                            'pattern': pattern_name,
-                            'line': line_num,
-                            'match': masked,
-                            'file': str(file_path),
-                        })
+            return []
+
+        if len(self._scan_cache) >= self._SCAN_CACHE_MAX:
+            self._scan_cache.clear()
+        self._scan_cache[key] = findings
+        return findings
+
+    def _scan_buffer(self, buf, file_label: str) -> List[Dict]:
+        """Scan a bytes buffer (mmap or bytes) with the combined pattern.
+
+        Line numbers are counted incrementally between matches so the
+        buffer is traversed once.
+        """
+        findings = []
+        line = 1
+        prev = 0
+        for match in _COMBINED_BYTES.finditer(buf):
+            start = match.start()
+            line += buf[prev:start].count(b'\n')
+            prev = start
+            masked = self._mask_value(
+                match.group(0).decode('utf-8', errors='replace'))
+            findings.append({
+                'pattern': match.lastgroup,
+                'line': line,
+                'match': masked,
+                'file': file_label,
+            })
 
         return findings
 
@@ -125,6 +220,13 @@ class CredentialScanner:
         Returns:
             Partially masked string.
         """
-        if len(value) <= 8:
-            return value[:2] + '*' * (len(value) - 2)
-        return value[:4] + '*' * (len(value) - 6) + value[-2:]
+        return _mask_value(value)
+
+
+@functools.lru_cache(maxsize=1024)
+def _mask_value(value: str) -> str:
+    """Mask a credential value, memoized since the same secrets recur
+    across repeated vault sweeps."""
+    if len(value) <= 8:
+        return value[:2] + '*' * (len(value) - 2)
+    return value[:4] + '*' * (len(value) - 6) + value[-2:]
@@ -5,9 +5,10 @@ Updates Dashboard.md with current statistics, metrics, and activity log.
 """
 
 import logging
+from collections import deque
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional
+from typing import Deque, Optional
 
 import frontmatter as fm_lib
 
@@ -97,7 +98,14 @@ class DashboardUpdater:
         self.dashboard_path = self.vault_path / 'Dashboard.md'
         self.vault_manager = VaultManager(vault_path)
         self.ops_logger = ops_logger
-        self._activity_log: List[str] = []
+        # deque(maxlen=...) evicts the oldest entry on append, so the
+        # activity cap needs no explicit trimming.
+        self._activity_log: Deque[str] = deque(
+            maxlen=self.MAX_ACTIVITY_ENTRIES)
+        # Snapshot of the dynamic fields behind the last render; when a
+        # refresh computes the same snapshot, the format + rewrite is
+        # skipped (see refresh_dashboard).
+        self._last_state: Optional[tuple] = None
         self._load_existing_activity()
 
     def _load_existing_activity(self) -> None:
@@ -119,23 +127,21 @@ class DashboardUpdater:
                 elif in_activity and line.startswith('- '):
                     self._activity_log.append(line[2:])  # Remove '- ' prefix
 
-            # Keep only last N entries
-            self._activity_log = self._activity_log[-self.MAX_ACTIVITY_ENTRIES:]
             logger.debug(f"Loaded {len(self._activity_log)} activity entries")
         except Exception as e:
             logger.error(f"Error loading activity log: {e}")
 
     def count_pending_tasks(self) -> int:
         """Count pending tasks in /Needs_Action."""
-        return len(self.vault_manager.get_pending_tasks())
+        return self.vault_manager.count_files('Needs_Action')
 
     def count_in_progress_tasks(self) -> int:
         """Count in-progress tasks in /In_Progress."""
-        return len(self.vault_manager.get_in_progress_tasks())
+        return self.vault_manager.count_files('In_Progress')
 
     def count_completed_tasks(self) -> int:
         """Count completed tasks in /Done."""
-        return len(self.vault_manager.get_completed_tasks())
+        return self.vault_manager.count_files('Done')
 
     def count_completed_today(self) -> int:
         """Count tasks completed today (by file modified date)."""
@@ -152,7 +158,7 @@ class DashboardUpdater:
 
     def count_plans(self) -> int:
         """Count generated plans in /Plans."""
-        return len(self.vault_manager.get_plans())
+        return self.vault_manager.count_files('Plans')
 
     def calculate_avg_completion_time(self) -> str:
         """
@@ -244,11 +250,6 @@ class DashboardUpdater:
         entry = f"{timestamp}: {message}"
 
         self._activity_log.append(entry)
-
-        # Keep only last N entries
-        if len(self._activity_log) > self.MAX_ACTIVITY_ENTRIES:
-            self._activity_log = self._activity_log[-self.MAX_ACTIVITY_ENTRIES:]
-
         logger.debug(f"Added activity: {entry}")
 
     def get_activity_log(self) -> str:
@@ -468,35 +469,48 @@ class DashboardUpdater:
         Returns:
             True if successful, False otherwise.
         """
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        fields = {
+            'activity_log': self.get_activity_log(),
+            'pending_count': self.count_pending_tasks(),
+            'in_progress_count': self.count_in_progress_tasks(),
+            'completed_today': self.count_completed_today(),
+            'completed_count': self.count_completed_tasks(),
+            'plans_count': self.count_plans(),
+            'avg_completion_time': self.calculate_avg_completion_time(),
+            'error_rate': self.calculate_error_rate(),
+            'rollback_count': self.count_rollback_incidents(),
+            'sla_compliance': self.compute_sla_compliance(),
+            'throughput': self.compute_throughput(),
+            'sla_predictions': self.count_sla_predictions(),
+            'self_heal_count': self.count_self_heal_recoveries(),
+            'risk_distribution': self.compute_risk_distribution(),
+            'learning_points': self.count_learning_points(),
+            'active_alerts': self.compute_active_alerts(),
+            'recent_errors': self.get_recent_errors(),
+            'watcher_status': self.get_watcher_status(
+                file_watcher_running, gmail_configured
+            ),
+        }
+
+        # Every dynamic section except the timestamp is in `fields`; when
+        # they all match the last render, rewriting would only bump the
+        # Last Updated line, so the format + write is skipped. The stale
+        # timestamp is the accepted trade-off for idle refresh loops.
+        state = tuple(fields.values())
+        if state == self._last_state and self.dashboard_path.exists():
+            logger.debug("Dashboard unchanged; skipping rewrite")
+            return True
 
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         content = DASHBOARD_TEMPLATE.format(
             timestamp=timestamp,
             last_active=timestamp,
-            activity_log=self.get_activity_log(),
-            pending_count=self.count_pending_tasks(),
-            in_progress_count=self.count_in_progress_tasks(),
-            completed_today=self.count_completed_today(),
-            completed_count=self.count_completed_tasks(),
-            plans_count=self.count_plans(),
-            avg_completion_time=self.calculate_avg_completion_time(),
-            error_rate=self.calculate_error_rate(),
-            rollback_count=self.count_rollback_incidents(),
-            sla_compliance=self.compute_sla_compliance(),
-            throughput=self.compute_throughput(),
-            sla_predictions=self.count_sla_predictions(),
-            self_heal_count=self.count_self_heal_recoveries(),
-            risk_distribution=self.compute_risk_distribution(),
-            learning_points=self.count_learning_points(),
-            active_alerts=self.compute_active_alerts(),
-            recent_errors=self.get_recent_errors(),
-            watcher_status=self.get_watcher_status(
-                file_watcher_running, gmail_configured
-            )
+            **fields,
         )
 
         try:
             self.dashboard_path.write_text(content, encoding='utf-8')
+            self._last_state = state
             logger.info("Dashboard refreshed")
             return True
         except Exception as e:
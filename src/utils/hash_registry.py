@@ -7,18 +7,44 @@ Prevents creating duplicate tasks for the same email/file.
 
 import hashlib
 import logging
+import mmap
 from pathlib import Path
 from typing import Set
 
+try:
+    import xxhash
+except ImportError:  # Optional — hashlib.md5 is used without it
+    xxhash = None
+
 logger = logging.getLogger(__name__)
 
 
+def _hash_hex(data: bytes) -> str:
+    """Hash bytes to 32 hex characters.
+
+    Dedup needs collision resistance, not cryptographic strength, so
+    prefer xxh3_128: 5-10x faster per byte than MD5 with the same
+    digest width. Falls back to MD5 when xxhash is not installed.
+    """
+    if xxhash is not None:
+        return xxhash.xxh3_128(data).hexdigest()
+    return hashlib.md5(data).hexdigest()
+
+
+def _new_hasher():
+    """Fresh incremental hasher matching _hash_hex's algorithm."""
+    return xxhash.xxh3_128() if xxhash is not None else hashlib.md5()
+
+
 class HashRegistry:
     """
     Manages a registry of content hashes for deduplication.
 
     Hashes are stored in a hidden .task_hashes file in the vault root.
-    Each line contains one MD5 hash (32 hex characters).
+    Each line contains one content hash (32 hex characters). In memory
+    each digest is held as its packed 16-byte form: roughly half the
+    RAM of the hex str per entry and cheaper set hashing/compares on
+    large registries.
     """
 
     def __init__(self, vault_path: Path):
@@ -30,21 +56,59 @@ class HashRegistry:
         """
         self.vault_path = Path(vault_path)
         self.hash_file = self.vault_path / '.task_hashes'
-        self._hashes: Set[str] = set()
+        self._hashes: Set[bytes] = set()
         self._load_hashes()
 
+    @staticmethod
+    def _to_key(content_hash) -> bytes:
+        """Normalize a hex str (or packed bytes) to the 16-byte set key.
+
+        Raises:
+            ValueError: If the input is not a valid 128-bit digest.
+        """
+        if isinstance(content_hash, bytes):
+            key = content_hash
+        else:
+            # bytes.fromhex validates the hex in one C-level pass; no
+            # per-character Python loop. It also skips ASCII spaces, so
+            # the length check below still rejects padded input.
+            key = bytes.fromhex(content_hash)
+        if len(key) != 16:
+            raise ValueError(f"expected 16-byte digest, got {len(key)}")
+        return key
+
     def _load_hashes(self) -> None:
-        """Load existing hashes from the registry file."""
+        """Load existing hashes from the registry file.
+
+        The file is mmap'd and scanned for newlines directly, so large
+        registries load without per-line str objects or a whole-file
+        decode; only the packed digests land on the heap.
+        """
         if not self.hash_file.exists():
             logger.debug("Hash registry file not found, starting fresh")
             return
 
         try:
-            with open(self.hash_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    hash_value = line.strip()
-                    if len(hash_value) == 32:  # Valid MD5 hash
-                        self._hashes.add(hash_value)
+            if self.hash_file.stat().st_size == 0:
+                return
+            with open(self.hash_file, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0,
+                              access=mmap.ACCESS_READ) as mm:
+                size = len(mm)
+                start = 0
+                while start < size:
+                    nl = mm.find(b'\n', start)
+                    end = nl if nl != -1 else size
+                    line = mm[start:end].strip()
+                    start = end + 1
+                    if len(line) == 32:  # Valid 128-bit hex hash
+                        try:
+                            self._hashes.add(
+                                bytes.fromhex(line.decode('ascii')))
+                        except (ValueError, UnicodeDecodeError):
+                            logger.warning(
+                                f"Skipping non-hex registry line: "
+                                f"{line[:8]!r}...")
             logger.info(f"Loaded {len(self._hashes)} hashes from registry")
         except Exception as e:
             logger.error(f"Error loading hash registry: {e}")
@@ -54,26 +118,28 @@ class HashRegistry:
         Add a hash to the registry.
 
         Args:
-            content_hash: MD5 hash string (32 characters)
+            content_hash: Hash string (32 hex characters)
 
         Returns:
             True if added successfully, False if already exists or error.
         """
-        if len(content_hash) != 32:
-            logger.error(f"Invalid hash length: {len(content_hash)}")
+        try:
+            key = self._to_key(content_hash)
+        except ValueError as e:
+            logger.error(f"Invalid hash: {e}")
             return False
 
-        if content_hash in self._hashes:
+        if key in self._hashes:
             logger.debug(f"Hash already exists: {content_hash[:8]}...")
             return False
 
         try:
-            # Append to file
+            # Append to file (hex lines keep the on-disk format stable)
             with open(self.hash_file, 'a', encoding='utf-8') as f:
-                f.write(content_hash + '\n')
+                f.write(key.hex() + '\n')
 
             # Add to in-memory set
-            self._hashes.add(content_hash)
+            self._hashes.add(key)
             logger.debug(f"Added hash: {content_hash[:8]}...")
             return True
         except Exception as e:
@@ -85,22 +151,25 @@ class HashRegistry:
         Check if a hash exists in the registry.
 
         Args:
-            content_hash: MD5 hash string to check.
+            content_hash: Hash string to check.
 
         Returns:
             True if hash exists, False otherwise.
         """
-        return content_hash in self._hashes
+        try:
+            return self._to_key(content_hash) in self._hashes
+        except ValueError:
+            return False
 
     def load_hashes(self) -> Set[str]:
         """
         Reload and return all hashes from the registry.
 
         Returns:
-            Set of all hash strings.
+            Set of all hash strings (hex form).
         """
         self._load_hashes()
-        return self._hashes.copy()
+        return {h.hex() for h in self._hashes}
 
     def clear(self) -> bool:
         """
@@ -123,15 +192,15 @@ class HashRegistry:
     @staticmethod
     def compute_hash(content: str) -> str:
         """
-        Compute MD5 hash of content.
+        Compute the dedup hash of content.
 
         Args:
             content: String content to hash.
 
         Returns:
-            32-character hexadecimal MD5 hash.
+            32-character hexadecimal hash.
         """
-        return hashlib.md5(content.encode('utf-8')).hexdigest()
+        return _hash_hex(content.encode('utf-8'))
 
     @staticmethod
     def compute_file_hash(file_path: Path, max_bytes: int = 1024) -> str:
@@ -143,18 +212,22 @@ class HashRegistry:
             max_bytes: Maximum bytes to read (default 1KB).
 
         Returns:
-            32-character hexadecimal MD5 hash.
+            32-character hexadecimal hash.
         """
         try:
             with open(file_path, 'rb') as f:
                 content = f.read(max_bytes)
-            # Include path in hash to differentiate files with same content
-            hash_input = str(file_path) + content.decode('utf-8', errors='ignore')
-            return hashlib.md5(hash_input.encode('utf-8')).hexdigest()
+            # Include path in hash to differentiate files with same
+            # content; feeding the raw bytes to the hasher skips the
+            # old decode -> concat -> re-encode round trip.
+            hasher = _new_hasher()
+            hasher.update(str(file_path).encode('utf-8'))
+            hasher.update(content)
+            return hasher.hexdigest()
         except Exception as e:
             logger.error(f"Error computing file hash: {e}")
             # Fall back to path-only hash
-            return hashlib.md5(str(file_path).encode('utf-8')).hexdigest()
+            return _hash_hex(str(file_path).encode('utf-8'))
 
     def __len__(self) -> int:
         """Return number of hashes in registry."""
@@ -5,14 +5,63 @@ Append-only JSON Lines logger for all task operations.
 Stored outside the Obsidian vault to prevent watcher detection.
 """
 
-import json
 import logging
+import os
+import time
+from collections import Counter, deque
 from pathlib import Path
 from datetime import datetime
 from typing import List, Optional
 
+from utils.json_io import dumps_line, loads
+
 logger = logging.getLogger(__name__)
 
+_REVERSE_BLOCK = 64 * 1024
+
+# Last formatted timestamp, keyed on its millisecond bucket; entries
+# logged within the same millisecond reuse the string instead of
+# re-running strftime.
+_TS_CACHE = (-1, '')
+
+
+def _timestamp_ms() -> str:
+    """Millisecond-precision timestamp, cached per millisecond."""
+    global _TS_CACHE
+    ms = time.time_ns() // 1_000_000
+    if ms == _TS_CACHE[0]:
+        return _TS_CACHE[1]
+    secs, msecs = divmod(ms, 1000)
+    ts = (datetime.fromtimestamp(secs).strftime('%Y-%m-%dT%H:%M:%S.')
+          + f'{msecs:03d}')
+    _TS_CACHE = (ms, ts)
+    return ts
+
+
+def _iter_lines_reverse(path: Path, block: int = _REVERSE_BLOCK):
+    """Yield non-empty lines of a file from last to first.
+
+    Reads fixed-size blocks backwards from EOF, carrying the partial
+    first line of each block into the next, so tail queries touch only
+    the end of the file instead of loading the whole log.
+    """
+    with open(path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        tail = b''
+        while pos > 0:
+            read_size = min(block, pos)
+            pos -= read_size
+            f.seek(pos)
+            lines = (f.read(read_size) + tail).split(b'\n')
+            tail = lines[0]
+            for line in reversed(lines[1:]):
+                line = line.strip()
+                if line:
+                    yield line
+        tail = tail.strip()
+        if tail:
+            yield tail
+
 
 class OperationsLogger:
     """
@@ -22,7 +71,7 @@ class OperationsLogger:
     destination, outcome, and detail.
     """
 
-    VALID_OPS = {
+    VALID_OPS = frozenset({
         'task_created', 'task_moved', 'plan_generated',
         'task_classified', 'task_executed', 'credential_flagged', 'error',
         # Gold Tier operations
@@ -33,8 +82,8 @@ class OperationsLogger:
         'sla_prediction', 'risk_scored', 'self_heal_retry',
         'self_heal_alternative', 'self_heal_partial', 'learning_update',
         'priority_adjusted', 'concurrency_queued',
-    }
-    VALID_OUTCOMES = {'success', 'failed', 'flagged'}
+    })
+    VALID_OUTCOMES = frozenset({'success', 'failed', 'flagged'})
 
     def __init__(self, log_path: Path):
         """
@@ -46,6 +95,46 @@ class OperationsLogger:
         self.log_path = Path(log_path)
         # Ensure parent directory exists
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        # Persistent O_APPEND fd, opened on first write. Holding it for
+        # the logger's lifetime turns each entry into a single atomic
+        # write syscall instead of an open/write/close round trip.
+        self._fd: Optional[int] = None
+        # Lazily-built op-type counts; invalidated on every write
+        self._op_counts: Optional[Counter] = None
+
+    def _open_fd(self) -> int:
+        return os.open(str(self.log_path),
+                       os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+
+    def _write(self, data: bytes) -> None:
+        """Append raw bytes via the persistent fd, reopening it once
+        if it went stale (e.g. the log file was removed underneath)."""
+        if self._fd is None:
+            self._fd = self._open_fd()
+        try:
+            os.write(self._fd, data)
+        except OSError:
+            os.close(self._fd)
+            self._fd = self._open_fd()
+            os.write(self._fd, data)
+
+    def close(self) -> None:
+        """Close the persistent append fd, if open."""
+        fd, self._fd = self._fd, None
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def __del__(self):
+        if getattr(self, '_fd', None) is not None:
+            self.close()
+
+    @staticmethod
+    def _timestamp() -> str:
+        """Millisecond-precision timestamp string for log entries."""
+        return _timestamp_ms()
 
     def log(self, op: str, file: str, src: str,
             dst: Optional[str] = None, outcome: str = 'success',
@@ -65,8 +154,7 @@ class OperationsLogger:
             True if entry written successfully.
         """
         entry = {
-            'ts': datetime.now().strftime('%Y-%m-%dT%H:%M:%S.') +
-                  f'{datetime.now().microsecond // 1000:03d}',
+            'ts': self._timestamp(),
             'op': op,
             'file': file,
             'src': src,
@@ -76,13 +164,45 @@ class OperationsLogger:
         }
 
         try:
-            with open(self.log_path, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(entry) + '\n')
+            self._write(dumps_line(entry))
+            self._op_counts = None
             return True
         except Exception as e:
             logger.error(f"Failed to write operations log: {e}")
             return False
 
+    def log_many(self, entries: List[dict]) -> bool:
+        """
+        Append several log entries with a single file write.
+
+        Args:
+            entries: Dicts with the same keys accepted by log()
+                (op, file, src, and optionally dst, outcome, detail).
+
+        Returns:
+            True if all entries were written successfully.
+        """
+        ts = self._timestamp()
+        lines = []
+        for e in entries:
+            lines.append(dumps_line({
+                'ts': ts,
+                'op': e['op'],
+                'file': e['file'],
+                'src': e['src'],
+                'dst': e.get('dst') or 'null',
+                'outcome': e.get('outcome', 'success'),
+                'detail': e.get('detail', ''),
+            }))
+
+        try:
+            self._write(b''.join(lines))
+            self._op_counts = None
+            return True
+        except Exception as e:
+            logger.error(f"Failed to write operations log batch: {e}")
+            return False
+
     def read_recent(self, n: int = 50) -> List[dict]:
         """
         Read the most recent N log entries.
@@ -97,21 +217,40 @@ class OperationsLogger:
             return []
 
         try:
-            with open(self.log_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-
             entries = []
-            for line in lines[-n:]:
-                line = line.strip()
-                if line:
-                    entries.append(json.loads(line))
-
-            entries.reverse()
+            for line in _iter_lines_reverse(self.log_path):
+                entries.append(loads(line))
+                if len(entries) >= n:
+                    break
             return entries
         except Exception as e:
             logger.error(f"Failed to read operations log: {e}")
             return []
 
+    def op_counts(self) -> dict:
+        """
+        Count entries per operation type across the whole log.
+
+        The result is cached until the next write, so repeated audit
+        checks don't re-parse the log file.
+
+        Returns:
+            Dict of op type -> entry count.
+        """
+        if self._op_counts is None:
+            counts = Counter()
+            if self.log_path.exists():
+                try:
+                    with open(self.log_path, 'r', encoding='utf-8') as f:
+                        for line in f:
+                            line = line.strip()
+                            if line:
+                                counts[loads(line)['op']] += 1
+                except Exception as e:
+                    logger.error(f"Failed to count operations: {e}")
+            self._op_counts = counts
+        return dict(self._op_counts)
+
     def count_errors(self, hours: int = 24) -> int:
         """
         Count error entries within the last N hours.
@@ -128,24 +267,27 @@ class OperationsLogger:
         if not self.log_path.exists():
             return 0
 
+        # Walk newest-first and stop at the first entry older than the
+        # window: appends are chronological, so everything before it is
+        # older still. Entries with unparsable timestamps are counted
+        # (matching the forward scan) but never end the walk.
         try:
-            with open(self.log_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    entry = json.loads(line)
+            for line in _iter_lines_reverse(self.log_path):
+                entry = loads(line)
+                try:
+                    ts = datetime.fromisoformat(
+                        entry['ts'].replace('.', ':', 2)
+                        if entry['ts'].count('.') > 1
+                        else entry['ts']
+                    )
+                except (ValueError, KeyError):
                     if entry.get('outcome') == 'failed':
-                        try:
-                            ts = datetime.fromisoformat(
-                                entry['ts'].replace('.', ':', 2)
-                                if entry['ts'].count('.') > 1
-                                else entry['ts']
-                            )
-                            if ts.timestamp() >= cutoff:
-                                count += 1
-                        except (ValueError, KeyError):
-                            count += 1  # Count if we can't parse timestamp
+                        count += 1
+                    continue
+                if ts.timestamp() < cutoff:
+                    break
+                if entry.get('outcome') == 'failed':
+                    count += 1
         except Exception as e:
             logger.error(f"Failed to count errors: {e}")
 
@@ -166,17 +308,71 @@ class OperationsLogger:
 
         errors = []
         try:
-            with open(self.log_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    entry = json.loads(line)
-                    if entry.get('outcome') == 'failed':
-                        errors.append(entry)
-
-            errors.reverse()
-            return errors[:n]
+            for line in _iter_lines_reverse(self.log_path):
+                entry = loads(line)
+                if entry.get('outcome') == 'failed':
+                    errors.append(entry)
+                    if len(errors) >= n:
+                        break
+            return errors
         except Exception as e:
             logger.error(f"Failed to get errors: {e}")
             return []
+
+
+class InMemoryOperationsLogger(OperationsLogger):
+    """
+    Drop-in OperationsLogger that keeps entries in memory.
+
+    Same interface as the file-backed logger, with no file opens, writes
+    or re-reads — for tests and ephemeral runs where log durability is
+    irrelevant. Entries live in a bounded deque so long sessions cannot
+    grow without limit.
+    """
+
+    def __init__(self, maxlen: int = 10_000):
+        self._entries: deque = deque(maxlen=maxlen)
+
+    def log(self, op: str, file: str, src: str,
+            dst: Optional[str] = None, outcome: str = 'success',
+            detail: str = '') -> bool:
+        self._entries.append({
+            'ts': self._timestamp(),
+            'op': op,
+            'file': file,
+            'src': src,
+            'dst': dst if dst else 'null',
+            'outcome': outcome,
+            'detail': detail,
+        })
+        return True
+
+    def log_many(self, entries: List[dict]) -> bool:
+        ts = self._timestamp()
+        for e in entries:
+            self._entries.append({
+                'ts': ts,
+                'op': e['op'],
+                'file': e['file'],
+                'src': e['src'],
+                'dst': e.get('dst') or 'null',
+                'outcome': e.get('outcome', 'success'),
+                'detail': e.get('detail', ''),
+            })
+        return True
+
+    def read_recent(self, n: int = 50) -> List[dict]:
+        entries = list(self._entries)[-n:]
+        entries.reverse()
+        return entries
+
+    def op_counts(self) -> dict:
+        return dict(Counter(e['op'] for e in self._entries))
+
+    def count_errors(self, hours: int = 24) -> int:
+        return sum(1 for e in self._entries if e.get('outcome') == 'failed')
+
+    def get_errors(self, n: int = 5) -> List[dict]:
+        errors = [e for e in self._entries if e.get('outcome') == 'failed']
+        errors.reverse()
+        return errors[:n]
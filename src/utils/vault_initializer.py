@@ -6,6 +6,7 @@ This is typically run once during initial setup.
 """
 
 import logging
+import os
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -89,15 +90,11 @@ def create_folders(vault_path: Path) -> bool:
     folders = ['Needs_Action', 'In_Progress', 'Done', 'Plans', 'Rollback_Archive', 'Learning_Data']
 
     try:
-        # Create vault root if it doesn't exist
-        vault_path.mkdir(parents=True, exist_ok=True)
-        logger.info(f"Created vault root: {vault_path}")
-
-        # Create subfolders
+        # One makedirs per leaf creates the vault root implicitly on
+        # the first call, so no separate root mkdir is needed.
         for folder in folders:
-            folder_path = vault_path / folder
-            folder_path.mkdir(exist_ok=True)
-            logger.info(f"Created folder: {folder_path}")
+            os.makedirs(vault_path / folder, exist_ok=True)
+        logger.info(f"Created vault folders under: {vault_path}")
 
         return True
     except Exception as e:
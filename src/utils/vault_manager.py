@@ -6,6 +6,7 @@ All task and plan files are stored as Markdown with YAML frontmatter.
 """
 
 import logging
+import os
 import shutil
 from pathlib import Path
 from typing import List, Optional
@@ -14,6 +15,8 @@ from datetime import datetime
 import yaml
 import frontmatter
 
+from utils.yaml_io import YAML_HANDLER
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,8 +33,8 @@ class VaultManager:
     - Company_Handbook.md: AI behavior rules
     """
 
-    REQUIRED_FOLDERS = ['Needs_Action', 'In_Progress', 'Done', 'Plans', 'Rollback_Archive']
-    REQUIRED_FILES = ['Dashboard.md', 'Company_Handbook.md']
+    REQUIRED_FOLDERS = ('Needs_Action', 'In_Progress', 'Done', 'Plans', 'Rollback_Archive')
+    REQUIRED_FILES = ('Dashboard.md', 'Company_Handbook.md')
 
     def __init__(self, vault_path: Path):
         """
@@ -46,6 +49,13 @@ class VaultManager:
         self.done_path = self.vault_path / 'Done'
         self.plans_path = self.vault_path / 'Plans'
         self.rollback_archive_path = self.vault_path / 'Rollback_Archive'
+        # Parsed-frontmatter cache keyed on relative path; entries carry
+        # the file's mtime_ns so any rewrite invalidates them. Polling
+        # loops re-read unchanged task files every pass — the cache
+        # turns those repeat parses into a stat() call.
+        self._fm_cache: dict = {}
+
+    _FM_CACHE_MAX = 512
 
     def validate_structure(self) -> tuple[bool, List[str]]:
         """
@@ -88,8 +98,18 @@ class VaultManager:
             return None
 
         try:
+            mtime = file_path.stat().st_mtime_ns
+            cached = self._fm_cache.get(relative_path)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+
             with open(file_path, 'r', encoding='utf-8') as f:
-                return frontmatter.load(f)
+                post = frontmatter.load(f, handler=YAML_HANDLER)
+
+            if len(self._fm_cache) >= self._FM_CACHE_MAX:
+                self._fm_cache.clear()
+            self._fm_cache[relative_path] = (mtime, post)
+            return post
         except Exception as e:
             logger.error(f"Error reading file {file_path}: {e}")
             return None
@@ -116,11 +136,12 @@ class VaultManager:
             if metadata:
                 post = frontmatter.Post(content, **metadata)
                 with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(frontmatter.dumps(post))
+                    f.write(frontmatter.dumps(post, handler=YAML_HANDLER))
             else:
                 with open(file_path, 'w', encoding='utf-8') as f:
                     f.write(content)
 
+            self._fm_cache.pop(relative_path, None)
             logger.info(f"Written file: {file_path}")
             return True
         except Exception as e:
@@ -145,6 +166,30 @@ class VaultManager:
 
         return sorted(folder_path.glob(pattern))
 
+    def count_files(self, folder: str, suffix: str = '.md') -> int:
+        """
+        Count files in a vault folder without building a sorted list.
+
+        os.scandir yields entries with type info in one pass, so this
+        skips list_files' per-entry stat and sort when callers only
+        need a count.
+
+        Args:
+            folder: Folder name (e.g., 'Needs_Action', 'Plans')
+            suffix: Filename suffix to match (default: .md)
+
+        Returns:
+            Number of matching files; 0 if the folder is missing.
+        """
+        folder_path = self.vault_path / folder
+        try:
+            with os.scandir(folder_path) as entries:
+                return sum(1 for e in entries
+                           if e.name.endswith(suffix) and e.is_file())
+        except FileNotFoundError:
+            logger.warning(f"Folder not found: {folder_path}")
+            return 0
+
     def move_file(self, source_relative: str, dest_relative: str) -> bool:
         """
         Move a file within the vault.
@@ -244,7 +289,7 @@ class VaultManager:
         file_path = self.vault_path / task_path
         try:
             with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(frontmatter.dumps(post))
+                f.write(frontmatter.dumps(post, handler=YAML_HANDLER))
             logger.info(f"Updated task status to '{new_status}': {task_path}")
             return True
         except Exception as e:
@@ -0,0 +1,39 @@
+"""
+YAML helpers routed through libyaml's C loader/dumper when available.
+
+PyYAML's pure-Python SafeLoader dominates frontmatter parse time on
+large vaults; CSafeLoader/CSafeDumper are drop-in replacements that
+produce identical output. Falls back to the pure-Python classes when
+PyYAML was built without libyaml.
+"""
+
+import yaml
+from frontmatter.default_handlers import YAMLHandler
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader, SafeDumper
+
+
+class CSafeYAMLHandler(YAMLHandler):
+    """frontmatter handler that swaps in the C loader/dumper.
+
+    Mirrors the stock YAMLHandler's defaults (safe mode, block style,
+    unicode) so frontmatter round-trips are byte-identical.
+    """
+
+    def load(self, fm: str, **kwargs):
+        kwargs.setdefault("Loader", SafeLoader)
+        return yaml.load(fm, **kwargs)
+
+    def export(self, metadata: dict, **kwargs) -> str:
+        kwargs.setdefault("Dumper", SafeDumper)
+        kwargs.setdefault("default_flow_style", False)
+        kwargs.setdefault("allow_unicode", True)
+        return yaml.dump(metadata, **kwargs).strip()
+
+
+# Shared handler instance; stateless, safe to pass to every
+# frontmatter.load/dumps call.
+YAML_HANDLER = CSafeYAMLHandler()
@@ -5,39 +5,164 @@ Provides common fixtures for vault setup and teardown.
 Platinum Tier adds Learning_Data folder and intelligence module fixtures.
 """
 
-import pytest
+import dataclasses
+import functools
+import os
+import re
+import sys
+import tempfile
 from pathlib import Path
 import shutil
 
+import pytest
+
+# Single src/ path hook for the whole suite; individual test modules
+# must not re-insert it (duplicate sys.path entries slow every import).
+_SRC = str(Path(__file__).parent.parent / 'src')
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
+
+# Route tmp_path (and everything else built on tempfile) to tmpfs when
+# available: vault tests are dominated by small-file metadata I/O, and
+# /dev/shm takes disk journaling out of the hot path. An explicit
+# TMPDIR wins, and platforms without /dev/shm (macOS, Windows) fall
+# through to the normal temp dir unchanged.
+if "TMPDIR" not in os.environ and os.access("/dev/shm", os.W_OK):
+    tempfile.tempdir = "/dev/shm"
+
+from intelligence.concurrency_controller import ConcurrencyController
+from intelligence.execution_graph import ExecutionGraph, ExecutionStep
+from intelligence.planning_engine import PlanningEngine
+from intelligence.self_healing import RecoveryAttempt, SelfHealingEngine
+from intelligence.sla_predictor import SLAPredictor
+from intelligence.risk_engine import RiskEngine, RiskScore
+from utils.operations_logger import OperationsLogger, InMemoryOperationsLogger
+from utils.vault_initializer import init_vault
+from utils.vault_manager import VaultManager
+
+
+# Required vault folders (Gold Tier includes Rollback_Archive) and file
+# contents, pre-encoded once at import so temp_vault setup avoids
+# per-test string re-encoding. Learning_Data is deliberately absent:
+# LearningEngine creates it on init, and everything else treats a
+# missing folder as "no data yet", so only tests that actually use
+# learning data pay for the directory.
+_VAULT_SUBDIRS = (
+    "Needs_Action", "In_Progress", "Done",
+    "Plans", "Rollback_Archive",
+)
+_DASHBOARD_BYTES = b"# Dashboard\n\n**Last Updated**: Test\n"
+_HANDBOOK_BYTES = b"# Company Handbook\n\nTest rules.\n"
+
+
+@pytest.fixture(scope="session")
+def _vault_template(tmp_path_factory):
+    """Vault skeleton built once per session; per-test vaults clone it."""
+    template = tmp_path_factory.mktemp("vault_template") / "test_vault"
+
+    for subdir in _VAULT_SUBDIRS:
+        os.makedirs(template / subdir)
+
+    (template / "Dashboard.md").write_bytes(_DASHBOARD_BYTES)
+    (template / "Company_Handbook.md").write_bytes(_HANDBOOK_BYTES)
+    (template / ".task_hashes").touch()
+
+    return template
+
 
 @pytest.fixture
-def temp_vault(tmp_path):
+def temp_vault(tmp_path, _vault_template):
     """
     Create a temporary vault structure for testing.
 
+    Clones the session skeleton instead of rebuilding it per test.
     Yields the vault path and cleans up after test.
     """
     vault_path = tmp_path / "test_vault"
-    vault_path.mkdir()
-
-    # Create required folders (Gold Tier includes Rollback_Archive, Platinum adds Learning_Data)
-    (vault_path / "Needs_Action").mkdir()
-    (vault_path / "In_Progress").mkdir()
-    (vault_path / "Done").mkdir()
-    (vault_path / "Plans").mkdir()
-    (vault_path / "Rollback_Archive").mkdir()
-    (vault_path / "Learning_Data").mkdir()
-
-    # Create required files
-    (vault_path / "Dashboard.md").write_text("# Dashboard\n\n**Last Updated**: Test\n")
-    (vault_path / "Company_Handbook.md").write_text("# Company Handbook\n\nTest rules.\n")
-    (vault_path / ".task_hashes").touch()
+    shutil.copytree(_vault_template, vault_path)
 
     yield vault_path
 
     # Cleanup is automatic with tmp_path
 
 
+@pytest.fixture(scope="session")
+def session_readonly_vault(tmp_path_factory, _vault_template):
+    """
+    One shared vault per session (per xdist worker) for tests that only
+    read the vault structure. Tests that create, move, or modify vault
+    files must use temp_vault instead.
+    """
+    vault_path = tmp_path_factory.mktemp("ro_vault") / "test_vault"
+    shutil.copytree(_vault_template, vault_path)
+    return vault_path
+
+
+@pytest.fixture(scope="session")
+def readonly_vault_manager(session_readonly_vault):
+    """Shared VaultManager over the read-only vault (read-only calls only)."""
+    return VaultManager(session_readonly_vault)
+
+
+@pytest.fixture(scope="session")
+def _initialized_vault_template(tmp_path_factory):
+    """Run init_vault once per session; tests copy the result."""
+    template = tmp_path_factory.mktemp("init_template") / "vault"
+    init_vault(template)
+    return template
+
+
+@pytest.fixture
+def initialized_vault(tmp_path, _initialized_vault_template):
+    """Per-test copy of the session-scoped init_vault template."""
+    vault_path = tmp_path / "test_vault"
+    shutil.copytree(_initialized_vault_template, vault_path)
+    return vault_path
+
+
+@pytest.hookimpl(hookwrapper=True, tryfirst=True)
+def pytest_runtest_makereport(item, call):
+    """Expose each phase's report on the item for fixture teardowns."""
+    outcome = yield
+    rep = outcome.get_result()
+    setattr(item, "rep_" + rep.when, rep)
+
+
+@pytest.fixture
+def tmp_path(tmp_path, request):
+    """
+    Wrap pytest's tmp_path to remove the tree as soon as the test ends.
+
+    Integration tests create whole vaults (folders, markdown, ops logs,
+    rollback snapshots); eager cleanup keeps disk usage flat during long
+    CI and pytest-xdist runs. Failed tests keep their directories for
+    post-mortem inspection.
+    """
+    yield tmp_path
+    rep_call = getattr(request.node, "rep_call", None)
+    if rep_call is None or not rep_call.failed:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+
+
+@pytest.fixture(scope="module")
+def _ops_log_path(tmp_path_factory):
+    """One log file per test module; ops_logger truncates it per test."""
+    return tmp_path_factory.mktemp("ops_logs") / "ops.log"
+
+
+@pytest.fixture
+def ops_logger(_ops_log_path):
+    """File-backed OperationsLogger over the shared, truncated log file."""
+    _ops_log_path.write_bytes(b"")
+    return OperationsLogger(_ops_log_path)
+
+
+@pytest.fixture
+def in_memory_ops_logger():
+    """OperationsLogger double that skips disk I/O entirely."""
+    return InMemoryOperationsLogger()
+
+
 @pytest.fixture
 def temp_watch_dir(tmp_path):
     """
@@ -50,10 +175,7 @@ def temp_watch_dir(tmp_path):
     yield watch_dir
 
 
-@pytest.fixture
-def sample_task_content():
-    """Sample task content for testing."""
-    return """---
+_SAMPLE_TASK_CONTENT = """---
 source: file_watcher
 created: 2026-02-10T12:00:00
 original_ref: /path/to/file.txt
@@ -73,11 +195,7 @@ This is a test task for unit testing.
 - **Original Reference**: /path/to/file.txt
 """
 
-
-@pytest.fixture
-def sample_plan_content():
-    """Sample plan content for testing."""
-    return """---
+_SAMPLE_PLAN_CONTENT = """---
 plan_id: plan-20260210-120000
 task_ref: 20260210-120000-test-task.md
 generated: 2026-02-10T12:00:00
@@ -102,76 +220,223 @@ Test plan for unit testing.
 """
 
 
+@functools.lru_cache(maxsize=256)
+def _render_task(status, source, created, body):
+    """Pre-encoded task file content, cached per distinct argument set."""
+    lines = [f"status: {status}", f"source: {source}"]
+    if created:
+        lines.append(f"created: {created}")
+    return (
+        "---\n" + "\n".join(lines) + "\n---\n\n" + body + "\n"
+    ).encode("utf-8")
+
+
+def _write_task(path, body, *, status, source="test", created=None):
+    """Write a task file with hand-rolled frontmatter.
+
+    Interpolating a template string skips frontmatter.dumps' YAML
+    serializer round trip per file, and the cached render amortizes
+    the format+encode across repeated fixtures; the output round-trips
+    identically through frontmatter.load.
+    """
+    path.write_bytes(_render_task(status, source, created, body))
+
+
+_FM_RE = re.compile(r"^---\n(.*?)\n---\n?(.*)", re.S)
+
+
+def _read_task_fast(path):
+    """(metadata, content) from a task file without the YAML parser.
+
+    Handles only the flat 'key: value' frontmatter these tests write;
+    verification of VaultManager's real parsing still goes through
+    read_file.
+    """
+    text = path.read_text(encoding="utf-8")
+    m = _FM_RE.match(text)
+    if m is None:
+        return {}, text
+    meta = dict(line.split(": ", 1) for line in m.group(1).splitlines())
+    return meta, m.group(2)
+
+
+@pytest.fixture(scope="session")
+def read_task_fast():
+    """Helper fixture: parse flat task frontmatter without YAML."""
+    return _read_task_fast
+
+
+def _scan_prefix(directory, prefix, suffix=".md"):
+    """Names in directory matching prefix/suffix, via one scandir pass.
+
+    Cheaper than pathlib.glob for flat directories: no per-entry stat
+    and no Path object per match.
+    """
+    with os.scandir(directory) as it:
+        return [e.name for e in it
+                if e.name.startswith(prefix) and e.name.endswith(suffix)]
+
+
+@pytest.fixture(scope="session")
+def scan_prefix():
+    """Helper fixture: list directory entries by name prefix/suffix."""
+    return _scan_prefix
+
+
+def _names_in(directory):
+    """All entry names in a directory from a single scandir pass."""
+    with os.scandir(directory) as it:
+        return {e.name for e in it}
+
+
+@pytest.fixture(scope="session")
+def names_in():
+    """Helper fixture: snapshot a directory's entry names as a set."""
+    return _names_in
+
+
+@pytest.fixture(scope="session")
+def write_task():
+    """Helper fixture: write a frontmatter task file cheaply."""
+    return _write_task
+
+
+@pytest.fixture(scope="session")
+def sample_task_content():
+    """Sample task content for testing."""
+    return _SAMPLE_TASK_CONTENT
+
+
+@pytest.fixture(scope="session")
+def sample_plan_content():
+    """Sample plan content for testing."""
+    return _SAMPLE_PLAN_CONTENT
+
+
 # ── Platinum Tier Fixtures ──────────────────────────────────────
 
 
+_PLATINUM_CONFIG = {
+    'vault_path': Path('/tmp/test_vault'),
+    'prediction_threshold': 0.7,
+    'max_parallel_tasks': 3,
+    'learning_window_days': 30,
+    'max_recovery_attempts': 3,
+    'task_timeout_minutes': 15,
+    'enable_predictive_sla': True,
+    'enable_self_healing': True,
+    'enable_risk_scoring': True,
+    'risk_weight_sla': 0.3,
+    'risk_weight_complexity': 0.2,
+    'risk_weight_impact': 0.3,
+    'risk_weight_failure': 0.2,
+    'sla_simple_minutes': 2,
+    'sla_complex_minutes': 10,
+    'operations_log_path': Path('/tmp/test_ops.log'),
+}
+
+
 @pytest.fixture
 def platinum_config():
-    """Default Platinum Tier configuration for testing."""
-    return {
-        'vault_path': Path('/tmp/test_vault'),
-        'prediction_threshold': 0.7,
-        'max_parallel_tasks': 3,
-        'learning_window_days': 30,
-        'max_recovery_attempts': 3,
-        'task_timeout_minutes': 15,
-        'enable_predictive_sla': True,
-        'enable_self_healing': True,
-        'enable_risk_scoring': True,
-        'risk_weight_sla': 0.3,
-        'risk_weight_complexity': 0.2,
-        'risk_weight_impact': 0.3,
-        'risk_weight_failure': 0.2,
-        'sla_simple_minutes': 2,
-        'sla_complex_minutes': 10,
-        'operations_log_path': Path('/tmp/test_ops.log'),
-    }
+    """Default Platinum Tier configuration for testing (fresh copy per test)."""
+    return dict(_PLATINUM_CONFIG)
+
+
+# Stateless engines constructed once per module. Tests that mutate the
+# config or attach an ops_logger build their own instances instead.
+
+
+@pytest.fixture(scope="module")
+def sla_predictor():
+    """Shared SLAPredictor with default Platinum config (no ops logger)."""
+    return SLAPredictor(dict(_PLATINUM_CONFIG))
+
+
+@pytest.fixture(scope="module")
+def risk_engine():
+    """Shared RiskEngine with default Platinum config (no ops logger)."""
+    return RiskEngine(dict(_PLATINUM_CONFIG))
+
+
+@pytest.fixture(scope="module")
+def self_healing_engine():
+    """Shared SelfHealingEngine with default Platinum config (no ops logger)."""
+    return SelfHealingEngine(dict(_PLATINUM_CONFIG))
 
 
 @pytest.fixture
-def make_execution_graph():
-    """Factory fixture for creating ExecutionGraphs."""
-    from intelligence.execution_graph import ExecutionGraph, ExecutionStep
+def cc(platinum_config):
+    """Fresh ConcurrencyController per test (slots/queue are stateful).
 
-    def _make(task_id="test_task.md", step_count=3, with_alternatives=False):
-        steps = []
-        for i in range(step_count):
-            alt = f"step_{i}_alt" if with_alternatives and i > 0 else None
-            step = ExecutionStep(
-                step_id=f"step_{i}",
-                name=f"Step {i}: action {i}",
+    Tests that tweak config knobs such as max_parallel_tasks still
+    construct their own controller from platinum_config.
+    """
+    return ConcurrencyController(config=platinum_config)
+
+
+@pytest.fixture(scope="module")
+def planning_engine_factory():
+    """Factory for PlanningEngines bound to a per-test vault path."""
+
+    def _make(vault_path, ops_logger=None):
+        return PlanningEngine(vault_path, dict(_PLATINUM_CONFIG),
+                              ops_logger=ops_logger)
+
+    return _make
+
+
+@functools.lru_cache(maxsize=16)
+def _graph_template(step_count, with_alternatives):
+    """Canonical (steps, edges) per shape; built once, cloned per test."""
+    steps = []
+    for i in range(step_count):
+        alt = f"step_{i}_alt" if with_alternatives and i > 0 else None
+        step = ExecutionStep(
+            step_id=f"step_{i}",
+            name=f"Step {i}: action {i}",
+            priority=i + 1,
+            estimated_duration=1.0,
+            alternative_step=alt,
+        )
+        steps.append(step)
+
+    # Add alternative steps if requested
+    if with_alternatives:
+        for i in range(1, step_count):
+            steps.append(ExecutionStep(
+                step_id=f"step_{i}_alt",
+                name=f"Alternative for step {i}",
                 priority=i + 1,
                 estimated_duration=1.0,
-                alternative_step=alt,
-            )
-            steps.append(step)
-
-        # Add alternative steps if requested
-        if with_alternatives:
-            for i in range(1, step_count):
-                steps.append(ExecutionStep(
-                    step_id=f"step_{i}_alt",
-                    name=f"Alternative for step {i}",
-                    priority=i + 1,
-                    estimated_duration=1.0,
-                ))
-
-        # Sequential edges
-        edges = {}
-        for i in range(step_count - 1):
-            edges[f"step_{i}"] = [f"step_{i + 1}"]
+            ))
+
+    # Sequential edges
+    edges = {}
+    for i in range(step_count - 1):
+        edges[f"step_{i}"] = [f"step_{i + 1}"]
+
+    return tuple(steps), edges
+
 
+@pytest.fixture(scope="module")
+def make_execution_graph():
+    """Factory fixture for creating ExecutionGraphs."""
+
+    def _make(task_id="test_task.md", step_count=3, with_alternatives=False):
+        steps, edges = _graph_template(step_count, with_alternatives)
+        # Shallow-clone so tests can mutate step status and edges freely
         return ExecutionGraph(
-            task_id=task_id, steps=steps, edges=edges,
+            task_id=task_id,
+            steps=[dataclasses.replace(s) for s in steps],
+            edges={src: list(dsts) for src, dsts in edges.items()},
         )
 
     return _make
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def make_recovery_attempt():
     """Factory fixture for creating RecoveryAttempt records."""
-    from intelligence.self_healing import RecoveryAttempt
 
     def _make(task_id="test_task.md", step_id="step_0",
               attempt_number=1, strategy="retry",
@@ -185,10 +450,9 @@ def make_recovery_attempt():
     return _make
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def make_risk_score():
     """Factory fixture for creating RiskScore objects."""
-    from intelligence.risk_engine import RiskScore
 
     def _make(task_id="test_task.md", sla_risk=0.5,
               complexity=0.33, impact=0.5, failure_rate=0.0):
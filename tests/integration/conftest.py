@@ -0,0 +1,23 @@
+"""
+Shared fixtures for integration tests.
+
+Stubs the Claude CLI plan generator so integration tests never fork a
+subprocess (or wait on its timeout) per pending task.
+"""
+
+import pytest
+
+_STUB_PLAN_STEPS = (
+    "- [ ] Step 1: Review the task\n"
+    "- [ ] Step 2: Execute the required actions\n"
+    "- [ ] Step 3: Verify results"
+)
+
+
+@pytest.fixture(autouse=True)
+def _stub_claude_cli(monkeypatch):
+    """Replace TaskProcessor.generate_plan with a canned plan."""
+    monkeypatch.setattr(
+        'processors.task_processor.TaskProcessor.generate_plan',
+        lambda self, title, content: _STUB_PLAN_STEPS,
+    )
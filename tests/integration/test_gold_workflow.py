@@ -9,32 +9,48 @@ Full workflow tests for Gold Tier features:
 - Dashboard metrics accuracy
 """
 
-import sys
-from pathlib import Path
 from datetime import datetime, timedelta
-from unittest.mock import patch
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
-
 import pytest
-import frontmatter
 
-from utils.operations_logger import OperationsLogger
 from utils.dashboard_updater import DashboardUpdater
 from processors.task_processor import TaskProcessor
-from processors.task_classifier import TaskClassifier
-from processors.task_executor import TaskExecutor
-from orchestrator.rollback_manager import RollbackManager
-from orchestrator.sla_tracker import SLATracker
 from notifications.notifier import NoOpNotifier
 
 
+@pytest.fixture
+def build_processor(temp_vault, in_memory_ops_logger, monkeypatch):
+    """
+    Factory fixture: build a TaskProcessor with a patched config.
+
+    Patches get_config once via monkeypatch (cheaper than mock.patch and
+    auto-reverted at teardown) and returns (processor, ops_logger).
+    The logger is the in-memory double — no disk I/O per log call.
+    """
+    def _build(**config_overrides):
+        monkeypatch.setattr(
+            'processors.task_processor.get_config',
+            lambda: config_overrides,
+        )
+        ops_logger = in_memory_ops_logger
+        processor = TaskProcessor(
+            temp_vault, ops_logger=ops_logger,
+            notifier=NoOpNotifier(), sla_tracker=None,
+        )
+        return processor, ops_logger
+
+    return _build
+
+
 def _create_task(vault_path, filename, content, metadata):
-    """Helper: write a task file with frontmatter into Needs_Action."""
+    """
+    Helper: write a task file with frontmatter into Needs_Action.
+
+    Formats the frontmatter block directly (all metadata values here are
+    plain scalars) instead of round-tripping through the YAML emitter.
+    """
     task_path = vault_path / "Needs_Action" / filename
-    post = frontmatter.Post(content, **metadata)
-    with open(task_path, 'w', encoding='utf-8') as f:
-        f.write(frontmatter.dumps(post))
+    fm_lines = "\n".join(f"{key}: {value}" for key, value in metadata.items())
+    task_path.write_bytes(f"---\n{fm_lines}\n---\n\n{content}".encode('utf-8'))
     return task_path
 
 
@@ -42,7 +58,7 @@ class TestGoldWorkflow:
     """Integration tests for the full Gold Tier workflow."""
 
     # ------------------------------------------------------------------ T078
-    def test_multi_step_lifecycle(self, temp_vault, tmp_path):
+    def test_multi_step_lifecycle(self, temp_vault, build_processor):
         """
         T078: Full Gold lifecycle — classify, snapshot, execute, done.
 
@@ -54,21 +70,13 @@ class TestGoldWorkflow:
         6. Gate results are stored in frontmatter
         """
         vault_path = temp_vault
-        log_path = tmp_path / "ops.log"
-        ops_logger = OperationsLogger(log_path)
 
         # Enable auto-execution for simple tasks
-        config_overrides = {
-            'auto_execute_simple': True,
-            'auto_execute_complex': False,
-            'rollback_retention_days': 7,
-        }
-
-        with patch('processors.task_processor.get_config', return_value=config_overrides):
-            processor = TaskProcessor(
-                vault_path, ops_logger=ops_logger,
-                notifier=NoOpNotifier(), sla_tracker=None,
-            )
+        processor, ops_logger = build_processor(
+            auto_execute_simple=True,
+            auto_execute_complex=False,
+            rollback_retention_days=7,
+        )
 
         task_content = "# Task: Create summary report\n\nPlease create a summary."
         task_metadata = {
@@ -86,8 +94,7 @@ class TestGoldWorkflow:
 
         plan_steps = "- [ ] Create file summary_report.md with overview"
 
-        with patch('processors.task_processor.get_config', return_value=config_overrides):
-            result = processor.classify_and_execute(task_path, plan_steps)
+        result = processor.classify_and_execute(task_path, plan_steps)
 
         # Classification ran
         assert result is not None
@@ -102,13 +109,12 @@ class TestGoldWorkflow:
         assert isinstance(result['gate_results'], dict)
 
         # Operations log has both entries
-        entries = ops_logger.read_recent(10)
-        ops = [e['op'] for e in entries]
+        ops = {e['op'] for e in ops_logger.read_recent(10)}
         assert 'task_classified' in ops
         assert 'task_executed' in ops
 
     # ------------------------------------------------------------------ T079
-    def test_rollback_on_failure(self, temp_vault, tmp_path):
+    def test_rollback_on_failure(self, temp_vault, build_processor):
         """
         T079: Complex task failure triggers rollback.
 
@@ -120,20 +126,12 @@ class TestGoldWorkflow:
         6. Rollback_Archive contains the snapshot with manifest.json
         """
         vault_path = temp_vault
-        log_path = tmp_path / "ops.log"
-        ops_logger = OperationsLogger(log_path)
-
-        config_overrides = {
-            'auto_execute_simple': True,
-            'auto_execute_complex': True,
-            'rollback_retention_days': 7,
-        }
 
-        with patch('processors.task_processor.get_config', return_value=config_overrides):
-            processor = TaskProcessor(
-                vault_path, ops_logger=ops_logger,
-                notifier=NoOpNotifier(), sla_tracker=None,
-            )
+        processor, ops_logger = build_processor(
+            auto_execute_simple=True,
+            auto_execute_complex=True,
+            rollback_retention_days=7,
+        )
 
         task_content = (
             "# Task: Deploy production\n\n"
@@ -162,8 +160,7 @@ class TestGoldWorkflow:
             "- [ ] Send deployment notification"
         )
 
-        with patch('processors.task_processor.get_config', return_value=config_overrides):
-            result = processor.classify_and_execute(task_path, plan_steps)
+        result = processor.classify_and_execute(task_path, plan_steps)
 
         assert result is not None
         assert result['classification'] == 'complex'
@@ -183,12 +180,11 @@ class TestGoldWorkflow:
         assert (snapshot / "task.md").exists()
 
         # Ops log records rollback_triggered
-        entries = ops_logger.read_recent(20)
-        ops = [e['op'] for e in entries]
+        ops = {e['op'] for e in ops_logger.read_recent(20)}
         assert 'rollback_triggered' in ops
 
     # ------------------------------------------------------------------ T080
-    def test_priority_ordering(self, temp_vault, tmp_path):
+    def test_priority_ordering(self, temp_vault, build_processor):
         """
         T080: Critical tasks are processed before normal tasks.
 
@@ -197,37 +193,27 @@ class TestGoldWorkflow:
         3. Ordering: critical > normal > low
         """
         vault_path = temp_vault
-        log_path = tmp_path / "ops.log"
-        ops_logger = OperationsLogger(log_path)
 
-        config_overrides = {
-            'auto_execute_simple': False,
-            'auto_execute_complex': False,
-            'rollback_retention_days': 7,
-        }
+        processor, _ = build_processor(
+            auto_execute_simple=False,
+            auto_execute_complex=False,
+            rollback_retention_days=7,
+        )
 
-        with patch('processors.task_processor.get_config', return_value=config_overrides):
-            processor = TaskProcessor(
-                vault_path, ops_logger=ops_logger,
-                notifier=NoOpNotifier(), sla_tracker=None,
-            )
-
-        # Create 3 tasks with varying priorities
-        _create_task(vault_path, "task-normal.md",
-                     "# Task: Normal priority task", {
-                         'status': 'pending', 'priority': 'normal',
-                         'source': 'file_watcher', 'version': 1,
-                     })
-        _create_task(vault_path, "task-critical.md",
-                     "# Task: Critical priority task", {
-                         'status': 'pending', 'priority': 'critical',
-                         'source': 'file_watcher', 'version': 1,
-                     })
-        _create_task(vault_path, "task-low.md",
-                     "# Task: Low priority task", {
-                         'status': 'pending', 'priority': 'low',
-                         'source': 'file_watcher', 'version': 1,
-                     })
+        # Create 3 tasks with varying priorities (shared metadata, one dict)
+        metadata = {
+            'status': 'pending', 'priority': 'normal',
+            'source': 'file_watcher', 'version': 1,
+        }
+        for filename, priority in [
+            ("task-normal.md", "normal"),
+            ("task-critical.md", "critical"),
+            ("task-low.md", "low"),
+        ]:
+            metadata['priority'] = priority
+            _create_task(vault_path, filename,
+                         f"# Task: {priority.capitalize()} priority task",
+                         metadata)
 
         pending = processor.read_pending_tasks()
         assert len(pending) >= 3
@@ -245,7 +231,7 @@ class TestGoldWorkflow:
         assert normal_idx < low_idx, "Normal task must be processed before low"
 
     # ------------------------------------------------------------------ T081
-    def test_sla_breach_detection(self, temp_vault, tmp_path):
+    def test_sla_breach_detection(self, temp_vault, in_memory_ops_logger):
         """
         T081: SLA breach is detected and logged when task exceeds threshold.
 
@@ -254,9 +240,10 @@ class TestGoldWorkflow:
         3. Ops log records sla_breach event
         4. Result dict has breach=True, compliant=False
         """
+        from orchestrator.sla_tracker import SLATracker
+
         vault_path = temp_vault
-        log_path = tmp_path / "ops.log"
-        ops_logger = OperationsLogger(log_path)
+        ops_logger = in_memory_ops_logger
 
         config = {
             'sla_simple_minutes': 2,
@@ -268,17 +255,17 @@ class TestGoldWorkflow:
         classified_time = (datetime.now() - timedelta(minutes=30)).isoformat()
         completed_time = datetime.now().isoformat()
 
-        task_metadata = {
-            'status': 'done',
-            'complexity': 'simple',
-            'classified_at': classified_time,
-            'completed_at': completed_time,
-            'version': 2,
-        }
         task_path = vault_path / "Done" / "20260211-sla-breach.md"
-        post = frontmatter.Post("# Task: Slow task", **task_metadata)
-        with open(task_path, 'w', encoding='utf-8') as f:
-            f.write(frontmatter.dumps(post))
+        task_path.write_text(
+            f"---\n"
+            f"status: done\n"
+            f"complexity: simple\n"
+            f"classified_at: '{classified_time}'\n"
+            f"completed_at: '{completed_time}'\n"
+            f"version: 2\n"
+            f"---\n\n"
+            f"# Task: Slow task\n"
+        )
 
         result = sla_tracker.check_sla(task_path)
 
@@ -290,7 +277,7 @@ class TestGoldWorkflow:
 
         # Ops log has sla_breach entry
         entries = ops_logger.read_recent(10)
-        ops = [e['op'] for e in entries]
+        ops = {e['op'] for e in entries}
         assert 'sla_breach' in ops
 
         # Verify the breach entry has correct detail
@@ -300,7 +287,7 @@ class TestGoldWorkflow:
         assert 'complexity:simple' in breach_entry['detail']
 
     # ------------------------------------------------------------------ T082
-    def test_dashboard_metrics_accuracy(self, temp_vault, tmp_path):
+    def test_dashboard_metrics_accuracy(self, temp_vault, in_memory_ops_logger):
         """
         T082: Dashboard metrics (rollback count, SLA compliance, throughput).
 
@@ -311,35 +298,26 @@ class TestGoldWorkflow:
         5. Throughput reflects completed tasks
         """
         vault_path = temp_vault
-        log_path = tmp_path / "ops.log"
-        ops_logger = OperationsLogger(log_path)
-
-        # Simulate 3 successful executions and 1 rollback in the ops log
-        ops_logger.log(
-            op='task_executed', file='task-a.md',
-            src='In_Progress', outcome='success',
-            detail='op:file_create complexity:simple',
-        )
-        ops_logger.log(
-            op='task_executed', file='task-b.md',
-            src='In_Progress', outcome='success',
-            detail='op:summarize complexity:simple',
-        )
-        ops_logger.log(
-            op='task_executed', file='task-c.md',
-            src='In_Progress', outcome='failed',
-            detail='op:unknown complexity:complex',
-        )
-        ops_logger.log(
-            op='rollback_triggered', file='task-c.md',
-            src='In_Progress', dst='Rollback_Archive',
-            outcome='success', detail='snapshot:20260211-task-c',
-        )
-        ops_logger.log(
-            op='sla_breach', file='task-b.md',
-            src='sla_tracker', outcome='flagged',
-            detail='duration:5.0min threshold:2min complexity:simple',
-        )
+        ops_logger = in_memory_ops_logger
+
+        # Simulate 3 executions, 1 rollback and 1 breach in one batch
+        ops_logger.log_many([
+            {'op': 'task_executed', 'file': 'task-a.md',
+             'src': 'In_Progress', 'outcome': 'success',
+             'detail': 'op:file_create complexity:simple'},
+            {'op': 'task_executed', 'file': 'task-b.md',
+             'src': 'In_Progress', 'outcome': 'success',
+             'detail': 'op:summarize complexity:simple'},
+            {'op': 'task_executed', 'file': 'task-c.md',
+             'src': 'In_Progress', 'outcome': 'failed',
+             'detail': 'op:unknown complexity:complex'},
+            {'op': 'rollback_triggered', 'file': 'task-c.md',
+             'src': 'In_Progress', 'dst': 'Rollback_Archive',
+             'outcome': 'success', 'detail': 'snapshot:20260211-task-c'},
+            {'op': 'sla_breach', 'file': 'task-b.md',
+             'src': 'sla_tracker', 'outcome': 'flagged',
+             'detail': 'duration:5.0min threshold:2min complexity:simple'},
+        ])
 
         dashboard = DashboardUpdater(vault_path, ops_logger=ops_logger)
 
@@ -6,16 +6,12 @@ plan generation → classification → execution → auto-move to Done →
 dashboard update → operations log verification.
 """
 
-import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
-
 import pytest
 import frontmatter
 
 from utils.vault_manager import VaultManager
-from utils.operations_logger import OperationsLogger
 from utils.dashboard_updater import DashboardUpdater
 from watchers.base_watcher import BaseWatcher
 from orchestrator.task_mover import TaskMover
@@ -24,10 +20,54 @@ from processors.task_executor import TaskExecutor
 from security.credential_scanner import CredentialScanner
 
 
+# File-type detection cases; Path objects built once at import
+_FILE_TYPE_CASES = [
+    (Path("report.txt"), 'document'),
+    (Path("photo.png"), 'image'),
+    (Path("data.csv"), 'data'),
+    (Path("message.eml"), 'email'),
+    (Path("binary.exe"), 'unknown'),
+]
+
+
+@pytest.fixture(scope="session")
+def credscan_vault(tmp_path_factory):
+    """Read-only vault pre-seeded with one clean and one flagged task."""
+    vault = tmp_path_factory.mktemp("credvault")
+    (vault / "Needs_Action").mkdir()
+    (vault / "Needs_Action" / "clean-task.md").write_bytes(
+        b"# Task: Clean task\n\nNo secrets here."
+    )
+    (vault / "Needs_Action" / "suspicious-task.md").write_bytes(
+        b"# Task: Config update\n\n"
+        b"api_key = AKIA1234567890ABCDEF\n"
+    )
+    return vault
+
+
+@pytest.fixture(scope="session")
+def cred_scanner():
+    """Shared CredentialScanner (stateless between scans)."""
+    return CredentialScanner()
+
+
+def _dump_task(metadata, body):
+    """Serialize a task file by hand, bypassing the YAML emitter.
+
+    The metadata values here are known-simple scalars (plain strings,
+    ISO dates), so "key: value" lines are already valid YAML. body is
+    pre-encoded bytes so rewrites skip the text-mode codec layer.
+    """
+    lines = [b"---"]
+    lines.extend(f"{k}: {v}".encode('utf-8') for k, v in metadata.items())
+    lines.extend((b"---", b"", body))
+    return b"\n".join(lines)
+
+
 class TestSilverWorkflow:
     """Integration tests for the full Silver Tier workflow."""
 
-    def test_full_lifecycle(self, temp_vault, tmp_path):
+    def test_full_lifecycle(self, temp_vault, ops_logger):
         """
         Test complete task lifecycle:
         1. Create task in Needs_Action (simulating watcher)
@@ -40,10 +80,8 @@ class TestSilverWorkflow:
         8. Operations log records all ops (US5)
         """
         vault_path = temp_vault
-        log_path = tmp_path / "operations.log"
 
         # Initialize components
-        ops_logger = OperationsLogger(log_path)
         vault_manager = VaultManager(vault_path)
         task_mover = TaskMover(vault_manager, ops_logger)
         classifier = TaskClassifier()
@@ -51,7 +89,7 @@ class TestSilverWorkflow:
         dashboard = DashboardUpdater(vault_path, ops_logger=ops_logger)
 
         # Step 1: Create task in Needs_Action with type tag (simulating watcher)
-        task_content = "# Task: Create a summary file\n\n## Content\n\nPlease create a summary."
+        task_content = b"# Task: Create a summary file\n\n## Content\n\nPlease create a summary."
         task_metadata = {
             'source': 'file_watcher',
             'type': 'document',
@@ -62,9 +100,8 @@ class TestSilverWorkflow:
         task_filename = "20260210-120000-summary-task.md"
         task_path = vault_path / "Needs_Action" / task_filename
 
-        post = frontmatter.Post(task_content, **task_metadata)
-        with open(task_path, 'w', encoding='utf-8') as f:
-            f.write(frontmatter.dumps(post))
+        task_bytes = _dump_task(task_metadata, task_content)
+        task_path.write_bytes(task_bytes)
 
         ops_logger.log(
             op='task_created', file=task_filename,
@@ -72,15 +109,17 @@ class TestSilverWorkflow:
             outcome='success', detail='type:document'
         )
 
-        # Verify: task exists in Needs_Action with type tag
+        # Verify: task exists in Needs_Action with type tag (parse once to
+        # prove the YAML round-trips; afterwards the metadata dict is the
+        # source of truth and the file is only rewritten, never re-parsed)
         assert task_path.exists()
-        loaded = frontmatter.load(str(task_path))
+        loaded = frontmatter.loads(task_path.read_text(encoding='utf-8'))
         assert loaded.metadata['type'] == 'document'
 
-        # Step 2: Simulate status change to 'in_progress' → TaskMover moves it
-        loaded.metadata['status'] = 'in_progress'
-        with open(task_path, 'w', encoding='utf-8') as f:
-            f.write(frontmatter.dumps(loaded))
+        # Step 2: Simulate status change to 'in_progress' → TaskMover moves
+        # it. Targeted byte replace: only the status line changes.
+        task_bytes = task_bytes.replace(b"status: pending", b"status: in_progress")
+        task_path.write_bytes(task_bytes)
 
         moved = task_mover.check_and_move_tasks()
         assert moved == 1
@@ -110,12 +149,11 @@ class TestSilverWorkflow:
             detail=f"op:{exec_result['operation']}"
         )
 
-        # Step 5: Simulate status change to 'done' → TaskMover moves to Done
-        loaded = frontmatter.load(str(in_progress_path))
-        loaded.metadata['status'] = 'done'
-        loaded.metadata['updated'] = '2026-02-10T12:05:00'
-        with open(in_progress_path, 'w', encoding='utf-8') as f:
-            f.write(frontmatter.dumps(loaded))
+        # Step 5: Simulate status change to 'done' → TaskMover moves to
+        # Done. This edit adds a key, so rebuild from the metadata dict.
+        task_metadata['status'] = 'done'
+        task_metadata['updated'] = '2026-02-10T12:05:00'
+        in_progress_path.write_bytes(_dump_task(task_metadata, task_content))
 
         moved = task_mover.check_and_move_tasks()
         assert moved == 1
@@ -130,8 +168,7 @@ class TestSilverWorkflow:
         assert "Completed" in dashboard_content
 
         # Step 7: Operations log has all entries
-        entries = ops_logger.read_recent(10)
-        ops = [e['op'] for e in entries]
+        ops = {e['op'] for e in ops_logger.read_recent(10)}
         assert 'task_created' in ops
         assert 'task_moved' in ops
         assert 'task_classified' in ops
@@ -153,40 +190,22 @@ class TestSilverWorkflow:
         classification = classifier.classify(task_content, plan_steps)
         assert classification == 'complex'
 
-    def test_credential_scan_integration(self, temp_vault):
+    def test_credential_scan_integration(self, credscan_vault, cred_scanner):
         """Test credential scanning across vault."""
-        vault_path = temp_vault
-        scanner = CredentialScanner()
-
-        # Create a clean task
-        clean_task = vault_path / "Needs_Action" / "clean-task.md"
-        clean_task.write_text("# Task: Clean task\n\nNo secrets here.")
-
-        # Create a suspicious task
-        suspicious_task = vault_path / "Needs_Action" / "suspicious-task.md"
-        suspicious_task.write_text(
-            "# Task: Config update\n\n"
-            "api_key = AKIA1234567890ABCDEF\n"
-        )
-
-        findings = scanner.scan_vault(vault_path)
+        findings = cred_scanner.scan_vault(credscan_vault)
         assert len(findings) > 0
         # Only the suspicious file should be flagged
         flagged_files = {f['file'] for f in findings}
-        assert str(suspicious_task) in flagged_files
-        assert str(clean_task) not in flagged_files
+        assert str(credscan_vault / "Needs_Action" / "suspicious-task.md") in flagged_files
+        assert str(credscan_vault / "Needs_Action" / "clean-task.md") not in flagged_files
 
-    def test_vault_structure_silver(self, temp_vault):
+    def test_vault_structure_silver(self, readonly_vault_manager):
         """Test that Silver Tier vault validates with In_Progress."""
-        manager = VaultManager(temp_vault)
-        is_valid, missing = manager.validate_structure()
+        is_valid, missing = readonly_vault_manager.validate_structure()
         assert is_valid is True
         assert len(missing) == 0
 
-    def test_file_type_detection(self):
+    @pytest.mark.parametrize("path,expected", _FILE_TYPE_CASES)
+    def test_file_type_detection(self, path, expected):
         """Test file type detection from base_watcher."""
-        assert BaseWatcher.detect_file_type(Path("report.txt")) == 'document'
-        assert BaseWatcher.detect_file_type(Path("photo.png")) == 'image'
-        assert BaseWatcher.detect_file_type(Path("data.csv")) == 'data'
-        assert BaseWatcher.detect_file_type(Path("message.eml")) == 'email'
-        assert BaseWatcher.detect_file_type(Path("binary.exe")) == 'unknown'
+        assert BaseWatcher.detect_file_type(path) == expected
@@ -2,86 +2,70 @@
 Unit tests for BranchRouter.
 """
 
-import os
-import sys
-import unittest
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+import pytest
 
 from processors.branch_router import BranchRouter, PRIORITY_LEVELS
 
 
-class TestBranchRouterDefaults(unittest.TestCase):
-    """Test default routing rules."""
-
-    def setUp(self):
-        self.router = BranchRouter()
-
-    def test_document_routes_to_summarize(self):
-        op, priority = self.router.route({'type': 'document', 'priority': 'normal'})
-        self.assertEqual(op, 'summarize')
+@pytest.fixture(scope="module")
+def router():
+    """Shared default-rules router (route() is read-only)."""
+    return BranchRouter()
 
-    def test_image_routes_to_file_copy(self):
-        op, priority = self.router.route({'type': 'image', 'priority': 'normal'})
-        self.assertEqual(op, 'file_copy')
 
-    def test_data_routes_to_summarize(self):
-        op, priority = self.router.route({'type': 'data'})
-        self.assertEqual(op, 'summarize')
-
-    def test_email_routes_to_summarize(self):
-        op, priority = self.router.route({'type': 'email'})
-        self.assertEqual(op, 'summarize')
-
-    def test_unknown_type_defaults_to_summarize(self):
-        op, priority = self.router.route({'type': 'video'})
-        self.assertEqual(op, 'summarize')
+class TestBranchRouterDefaults:
+    """Test default routing rules."""
 
-    def test_missing_type_defaults_to_summarize(self):
-        op, priority = self.router.route({})
-        self.assertEqual(op, 'summarize')
+    @pytest.mark.parametrize("metadata,expected_op", [
+        ({'type': 'document', 'priority': 'normal'}, 'summarize'),
+        ({'type': 'image', 'priority': 'normal'}, 'file_copy'),
+        ({'type': 'data'}, 'summarize'),
+        ({'type': 'email'}, 'summarize'),
+        ({'type': 'video'}, 'summarize'),  # unknown type
+        ({}, 'summarize'),  # missing type
+    ])
+    def test_default_routing(self, router, metadata, expected_op):
+        op, _ = router.route(metadata)
+        assert op == expected_op
 
 
-class TestBranchRouterCustomRules(unittest.TestCase):
+class TestBranchRouterCustomRules:
     """Test custom routing rules."""
 
     def test_custom_rules_override_defaults(self):
         router = BranchRouter(custom_rules={'document': 'file_copy'})
         op, _ = router.route({'type': 'document'})
-        self.assertEqual(op, 'file_copy')
+        assert op == 'file_copy'
 
     def test_custom_rules_add_new_types(self):
         router = BranchRouter(custom_rules={'video': 'file_create'})
         op, _ = router.route({'type': 'video'})
-        self.assertEqual(op, 'file_create')
+        assert op == 'file_create'
 
     def test_default_rules_preserved_with_custom(self):
         router = BranchRouter(custom_rules={'video': 'file_create'})
         op, _ = router.route({'type': 'image'})
-        self.assertEqual(op, 'file_copy')
+        assert op == 'file_copy'
 
 
-class TestBranchRouterPriority(unittest.TestCase):
+class TestBranchRouterPriority:
     """Test priority handling."""
 
-    def setUp(self):
-        self.router = BranchRouter()
-
-    def test_priority_returned(self):
-        _, priority = self.router.route({'type': 'document', 'priority': 'critical'})
-        self.assertEqual(priority, 'critical')
-
-    def test_invalid_priority_defaults_to_normal(self):
-        _, priority = self.router.route({'type': 'document', 'priority': 'invalid'})
-        self.assertEqual(priority, 'normal')
-
-    def test_priority_values(self):
-        self.assertEqual(self.router.get_priority_value('critical'), 4)
-        self.assertEqual(self.router.get_priority_value('high'), 3)
-        self.assertEqual(self.router.get_priority_value('normal'), 2)
-        self.assertEqual(self.router.get_priority_value('low'), 1)
-        self.assertEqual(self.router.get_priority_value('invalid'), 2)
-
-
-if __name__ == '__main__':
-    unittest.main()
+    def test_priority_returned(self, router):
+        _, priority = router.route({'type': 'document', 'priority': 'critical'})
+        assert priority == 'critical'
+
+    def test_invalid_priority_defaults_to_normal(self, router):
+        _, priority = router.route({'type': 'document', 'priority': 'invalid'})
+        assert priority == 'normal'
+
+    @pytest.mark.parametrize("priority,expected", [
+        ('critical', 4),
+        ('high', 3),
+        ('normal', 2),
+        ('low', 1),
+        ('invalid', 2),
+    ])
+    def test_priority_values(self, router, priority, expected):
+        assert router.get_priority_value(priority) == expected
@@ -1,5 +1,8 @@
 """Unit tests for ConcurrencyController (Platinum P6)."""
 
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
 import pytest
 from intelligence.concurrency_controller import ConcurrencyController, ConcurrencySlot
 
@@ -27,23 +30,24 @@ class TestConcurrencySlot:
         assert "started_at" in d
 
 
+def _drain(cc, n):
+    """Acquire n slots and return them in order."""
+    return [cc.acquire(f"{i}.md") for i in range(n)]
+
+
 class TestAcquireRelease:
-    def test_acquire_returns_slot(self, platinum_config):
-        cc = ConcurrencyController(config=platinum_config)
+    def test_acquire_returns_slot(self, cc):
         slot = cc.acquire("task.md")
         assert slot is not None
         assert slot.task_id == "task.md"
         assert slot.status == "active"
 
-    def test_acquire_up_to_max(self, platinum_config):
-        platinum_config["max_parallel_tasks"] = 2
+    @pytest.mark.parametrize("max_parallel", [1, 2, 4])
+    def test_acquire_up_to_max(self, platinum_config, max_parallel):
+        platinum_config["max_parallel_tasks"] = max_parallel
         cc = ConcurrencyController(config=platinum_config)
-        s1 = cc.acquire("a.md")
-        s2 = cc.acquire("b.md")
-        s3 = cc.acquire("c.md")
-        assert s1 is not None
-        assert s2 is not None
-        assert s3 is None
+        assert all(s is not None for s in _drain(cc, max_parallel))
+        assert cc.acquire("overflow.md") is None
 
     def test_release_frees_slot(self, platinum_config):
         platinum_config["max_parallel_tasks"] = 1
@@ -61,37 +65,29 @@ class TestAcquireRelease:
         slot2 = cc.acquire("b.md")
         assert slot2 is not None
 
-    def test_active_count(self, platinum_config):
-        cc = ConcurrencyController(config=platinum_config)
+    def test_active_count(self, cc):
         assert cc.get_active_count() == 0
-        s1 = cc.acquire("a.md")
-        assert cc.get_active_count() == 1
-        s2 = cc.acquire("b.md")
+        s1, _ = _drain(cc, 2)
         assert cc.get_active_count() == 2
         cc.release(s1.slot_id)
         assert cc.get_active_count() == 1
 
-    def test_slot_ids_increment(self, platinum_config):
-        cc = ConcurrencyController(config=platinum_config)
-        s1 = cc.acquire("a.md")
-        s2 = cc.acquire("b.md")
+    def test_slot_ids_increment(self, cc):
+        s1, s2 = _drain(cc, 2)
         assert s2.slot_id == s1.slot_id + 1
 
 
 class TestQueue:
-    def test_queue_and_dequeue(self, platinum_config):
-        cc = ConcurrencyController(config=platinum_config)
+    def test_queue_and_dequeue(self, cc):
         cc.queue("low.md", risk_score=0.2)
         cc.queue("high.md", risk_score=0.9)
         task = cc.dequeue()
         assert task == "high.md"
 
-    def test_dequeue_empty_returns_none(self, platinum_config):
-        cc = ConcurrencyController(config=platinum_config)
+    def test_dequeue_empty_returns_none(self, cc):
         assert cc.dequeue() is None
 
-    def test_get_queued_order(self, platinum_config):
-        cc = ConcurrencyController(config=platinum_config)
+    def test_get_queued_order(self, cc):
         cc.queue("low.md", risk_score=0.1)
         cc.queue("mid.md", risk_score=0.5)
         cc.queue("high.md", risk_score=0.9)
@@ -99,8 +95,7 @@ class TestQueue:
         assert queued[0][0] == "high.md"
         assert queued[-1][0] == "low.md"
 
-    def test_queue_multiple_same_risk(self, platinum_config):
-        cc = ConcurrencyController(config=platinum_config)
+    def test_queue_multiple_same_risk(self, cc):
         cc.queue("a.md", risk_score=0.5)
         cc.queue("b.md", risk_score=0.5)
         queued = cc.get_queued()
@@ -108,18 +103,21 @@ class TestQueue:
 
 
 class TestTimeouts:
-    def test_no_timeouts_fresh_slots(self, platinum_config):
-        cc = ConcurrencyController(config=platinum_config)
+    def test_no_timeouts_fresh_slots(self, cc):
         cc.acquire("a.md")
         timed = cc.check_timeouts()
         assert timed == []
 
-    def test_timeout_expired_slot(self, platinum_config):
-        platinum_config["task_timeout_minutes"] = 0
-        cc = ConcurrencyController(config=platinum_config)
+    def test_timeout_expired_slot(self, cc, monkeypatch):
         cc.acquire("a.md")
-        import time
-        time.sleep(0.01)
+        # Advance the controller's clock past the timeout instead of
+        # sleeping: deterministic and instant.
+        future = datetime.now() + timedelta(minutes=cc.timeout_minutes + 1)
+        monkeypatch.setattr(
+            "intelligence.concurrency_controller.datetime",
+            SimpleNamespace(now=lambda: future,
+                            fromisoformat=datetime.fromisoformat),
+        )
         timed = cc.check_timeouts()
         assert "a.md" in timed
         assert cc.get_active_count() == 0
@@ -4,12 +4,34 @@ Unit tests for DashboardUpdater.
 
 import pytest
 from pathlib import Path
-import sys
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
 
 from utils.dashboard_updater import DashboardUpdater, DASHBOARD_TEMPLATE
-from utils.operations_logger import OperationsLogger
+from utils.operations_logger import InMemoryOperationsLogger
+
+
+@pytest.fixture
+def temp_vault(fs):
+    """In-memory vault via pyfakefs, overriding the shared fixture.
+
+    Dashboard tests only count directory entries and rewrite
+    Dashboard.md, so every write can stay in RAM.
+    """
+    vault_path = Path("/vault")
+    for subdir in ("Needs_Action", "In_Progress", "Done",
+                   "Plans", "Rollback_Archive"):
+        fs.create_dir(vault_path / subdir)
+    fs.create_file(vault_path / "Dashboard.md",
+                   contents="# Dashboard\n\n**Last Updated**: Test\n")
+    fs.create_file(vault_path / "Company_Handbook.md",
+                   contents="# Company Handbook\n\nTest rules.\n")
+    return vault_path
+
+
+@pytest.fixture
+def ops_logger():
+    """In-memory logger double; the on-disk JSONL format is covered by
+    the silver workflow integration test."""
+    return InMemoryOperationsLogger()
 
 
 class TestDashboardUpdater:
@@ -222,11 +244,8 @@ class TestDashboardUpdater:
         result = updater.calculate_error_rate()
         assert "N/A" in result
 
-    def test_calculate_error_rate_with_logger(self, temp_vault, tmp_path):
+    def test_calculate_error_rate_with_logger(self, temp_vault, ops_logger):
         """Test error rate calculation with OperationsLogger."""
-        log_path = tmp_path / "ops.jsonl"
-        ops_logger = OperationsLogger(log_path)
-
         # Log some entries including errors
         ops_logger.log(op='task_created', file='ok.md', src='watcher', outcome='success')
         ops_logger.log(op='error', file='bad.md', src='executor', outcome='failed',
@@ -245,20 +264,16 @@ class TestDashboardUpdater:
         result = updater.get_recent_errors()
         assert "No error logger configured" in result
 
-    def test_get_recent_errors_no_errors(self, temp_vault, tmp_path):
+    def test_get_recent_errors_no_errors(self, temp_vault, ops_logger):
         """Test recent errors when logger has no errors."""
-        log_path = tmp_path / "ops.jsonl"
-        ops_logger = OperationsLogger(log_path)
         ops_logger.log(op='task_created', file='ok.md', src='watcher', outcome='success')
 
         updater = DashboardUpdater(temp_vault, ops_logger=ops_logger)
         result = updater.get_recent_errors()
         assert "No recent errors" in result
 
-    def test_get_recent_errors_with_errors(self, temp_vault, tmp_path):
+    def test_get_recent_errors_with_errors(self, temp_vault, ops_logger):
         """Test recent errors formatting with actual errors."""
-        log_path = tmp_path / "ops.jsonl"
-        ops_logger = OperationsLogger(log_path)
         ops_logger.log(op='error', file='fail.md', src='executor', outcome='failed',
                        detail='Something went wrong')
 
@@ -267,11 +282,8 @@ class TestDashboardUpdater:
         assert "fail.md" in result
         assert "Something went wrong" in result
 
-    def test_silver_template_rendering(self, temp_vault, tmp_path):
+    def test_silver_template_rendering(self, temp_vault, ops_logger):
         """Test that Silver template renders with In-Progress, Avg Completion Time, Error Rate."""
-        log_path = tmp_path / "ops.jsonl"
-        ops_logger = OperationsLogger(log_path)
-
         updater = DashboardUpdater(temp_vault, ops_logger=ops_logger)
 
         # Add some in-progress tasks
@@ -289,11 +301,8 @@ class TestDashboardUpdater:
         assert "Recent Errors" in content
         assert "Metrics" in content
 
-    def test_silver_template_has_in_progress_count(self, temp_vault, tmp_path):
+    def test_silver_template_has_in_progress_count(self, temp_vault, ops_logger):
         """Test that refreshed dashboard shows correct in-progress count."""
-        log_path = tmp_path / "ops.jsonl"
-        ops_logger = OperationsLogger(log_path)
-
         updater = DashboardUpdater(temp_vault, ops_logger=ops_logger)
 
         (temp_vault / "In_Progress" / "ip1.md").write_text("# IP 1")
@@ -2,12 +2,6 @@
 Unit tests for HashRegistry.
 """
 
-import pytest
-from pathlib import Path
-import sys
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
-
 from utils.hash_registry import HashRegistry
 
 
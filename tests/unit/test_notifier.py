@@ -1,12 +1,9 @@
 """Unit tests for Notifier and WebhookNotifier."""
 
-import os
-import sys
+import json
 import unittest
 from unittest.mock import patch, MagicMock
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
-
 from notifications.notifier import NoOpNotifier
 from notifications.webhook_notifier import WebhookNotifier
 
@@ -28,9 +25,9 @@ class TestNoOpNotifier(unittest.TestCase):
 class TestWebhookNotifier(unittest.TestCase):
     """Test WebhookNotifier."""
 
-    @patch('notifications.webhook_notifier.urlopen')
-    def test_successful_send(self, mock_urlopen):
-        mock_urlopen.return_value = MagicMock()
+    @patch.object(WebhookNotifier, '_post')
+    def test_successful_send(self, mock_post):
+        mock_post.return_value = None
         notifier = WebhookNotifier('http://localhost:8080/webhook')
         result = notifier.send({
             'task_name': 'test.md',
@@ -38,20 +35,20 @@ class TestWebhookNotifier(unittest.TestCase):
             'new_status': 'done',
         })
         self.assertTrue(result)
-        mock_urlopen.assert_called_once()
+        mock_post.assert_called_once()
 
-    @patch('notifications.webhook_notifier.urlopen')
-    def test_failure_returns_false_no_raise(self, mock_urlopen):
+    @patch.object(WebhookNotifier, '_post')
+    def test_failure_returns_false_no_raise(self, mock_post):
         from urllib.error import URLError
-        mock_urlopen.side_effect = URLError('Connection refused')
+        mock_post.side_effect = URLError('Connection refused')
         notifier = WebhookNotifier('http://localhost:8080/webhook')
         result = notifier.send({'task_name': 'test.md', 'new_status': 'done'})
         self.assertFalse(result)
 
-    @patch('notifications.webhook_notifier.urlopen')
-    def test_failure_logs_notification_failed(self, mock_urlopen):
+    @patch.object(WebhookNotifier, '_post')
+    def test_failure_logs_notification_failed(self, mock_post):
         from urllib.error import URLError
-        mock_urlopen.side_effect = URLError('Connection refused')
+        mock_post.side_effect = URLError('Connection refused')
         mock_logger = MagicMock()
         notifier = WebhookNotifier(
             'http://localhost:8080/webhook', ops_logger=mock_logger
@@ -62,5 +59,35 @@ class TestWebhookNotifier(unittest.TestCase):
         self.assertEqual(call_args.kwargs.get('op') or call_args[1].get('op', ''), 'notification_failed')
 
 
+class TestWebhookNotifierAsync(unittest.TestCase):
+    """Test async batched dispatch mode."""
+
+    @patch.object(WebhookNotifier, '_post')
+    def test_async_send_batches_events(self, mock_post):
+        notifier = WebhookNotifier(
+            'http://localhost:8080/webhook', async_dispatch=True
+        )
+        for i in range(3):
+            self.assertTrue(notifier.send(
+                {'task_name': f'task{i}.md', 'new_status': 'done'}
+            ))
+        notifier.flush(timeout=5)
+
+        sent = sum(
+            len(json.loads(call.args[0]))
+            for call in mock_post.call_args_list
+        )
+        self.assertEqual(sent, 3)
+
+    @patch.object(WebhookNotifier, '_post')
+    def test_async_failure_does_not_raise(self, mock_post):
+        mock_post.side_effect = OSError('Connection refused')
+        notifier = WebhookNotifier(
+            'http://localhost:8080/webhook', async_dispatch=True
+        )
+        self.assertTrue(notifier.send({'task_name': 'test.md'}))
+        notifier.flush(timeout=5)  # worker survives the failed POST
+
+
 if __name__ == '__main__':
     unittest.main()
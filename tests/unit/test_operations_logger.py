@@ -3,13 +3,6 @@ Unit tests for OperationsLogger.
 """
 
 import json
-import pytest
-from pathlib import Path
-import sys
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
-
 from utils.operations_logger import OperationsLogger
 
 
@@ -2,7 +2,7 @@
 
 import json
 import pytest
-from intelligence.planning_engine import PlanningEngine, TASK_TEMPLATES, TYPE_KEYWORDS
+from intelligence.planning_engine import EmptyTaskError, PlanningEngine, TASK_TEMPLATES, TYPE_KEYWORDS
 from intelligence.execution_graph import ExecutionGraph
 
 
@@ -30,11 +30,11 @@ class TestDecompose:
         assert len(graph.steps) == len(TASK_TEMPLATES["report"])
 
     def test_raises_on_empty_content(self, tmp_path):
-        with pytest.raises(ValueError, match="empty"):
+        with pytest.raises(EmptyTaskError):
             self._engine(tmp_path).decompose("")
 
     def test_raises_on_whitespace_content(self, tmp_path):
-        with pytest.raises(ValueError, match="empty"):
+        with pytest.raises(EmptyTaskError):
             self._engine(tmp_path).decompose("   \n\t  ")
 
     def test_generates_sequential_edges(self, tmp_path):
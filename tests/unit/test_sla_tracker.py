@@ -1,15 +1,11 @@
 """Unit tests for SLATracker."""
 
-import os
-import sys
 import tempfile
 import unittest
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
-
 import frontmatter
 from orchestrator.sla_tracker import SLATracker
 
@@ -29,7 +25,7 @@ class TestSLACheck(unittest.TestCase):
             'classified_at': classified_at.isoformat(),
             'completed_at': completed_at.isoformat(),
         })
-        path.write_text(frontmatter.dumps(post), encoding='utf-8')
+        path.write_bytes(frontmatter.dumps(post).encode('utf-8'))
         return path
 
     def test_compliant_simple_task(self):
@@ -51,7 +47,7 @@ class TestSLACheck(unittest.TestCase):
     def test_missing_timestamps_returns_compliant(self):
         path = Path(self.tmp) / 'task2.md'
         post = frontmatter.Post('# Task', status='done')
-        path.write_text(frontmatter.dumps(post), encoding='utf-8')
+        path.write_bytes(frontmatter.dumps(post).encode('utf-8'))
         tracker = SLATracker(config=self.config)
         result = tracker.check_sla(path)
         self.assertTrue(result['compliant'])
@@ -2,13 +2,6 @@
 Unit tests for TaskClassifier.
 """
 
-import pytest
-from pathlib import Path
-import sys
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
-
 from processors.task_classifier import TaskClassifier
 
 
@@ -2,13 +2,6 @@
 Unit tests for TaskExecutor.
 """
 
-import pytest
-from pathlib import Path
-import sys
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
-
 from processors.task_executor import TaskExecutor
 
 
@@ -108,7 +101,7 @@ class TestTaskExecutor:
         assert result['step_results'][0]['operation'] == 'unknown'
         assert 'not in allowlist' in result['detail']
 
-    def test_execute_file_create_produces_output_file(self, temp_vault):
+    def test_execute_file_create_produces_output_file(self, temp_vault, scan_prefix):
         """Test that file_create actually creates an output file on disk."""
         executor = TaskExecutor(temp_vault)
 
@@ -121,10 +114,9 @@ class TestTaskExecutor:
         assert result['success'] is True
 
         # Check that an output file was created in In_Progress
-        output_files = list((temp_vault / 'In_Progress').glob('output-*.md'))
-        assert len(output_files) >= 1
+        assert scan_prefix(temp_vault / 'In_Progress', 'output-')
 
-    def test_execute_summarize_produces_summary_file(self, temp_vault):
+    def test_execute_summarize_produces_summary_file(self, temp_vault, scan_prefix):
         """Test that summarize creates a summary file on disk."""
         executor = TaskExecutor(temp_vault)
 
@@ -138,8 +130,7 @@ class TestTaskExecutor:
         result = executor.execute(task_path, plan_steps)
         assert result['success'] is True
 
-        summary_files = list((temp_vault / 'In_Progress').glob('summary-*.md'))
-        assert len(summary_files) >= 1
+        assert scan_prefix(temp_vault / 'In_Progress', 'summary-')
 
     def test_execute_file_copy_nonexistent_source(self, temp_vault):
         """Test file_copy with a source file that does not exist."""
@@ -2,11 +2,7 @@
 Unit tests for vault_initializer module.
 """
 
-import pytest
 from pathlib import Path
-import sys
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
 
 from utils.vault_initializer import (
     create_folders,
@@ -101,7 +97,9 @@ class TestVaultInitializer:
 
     def test_init_vault_default_path(self, tmp_path, monkeypatch):
         """Test vault initialization with default path."""
-        monkeypatch.chdir(tmp_path)
+        # Patch Path.cwd rather than chdir: still exercises the None
+        # branch without mutating process-global working directory.
+        monkeypatch.setattr(Path, 'cwd', classmethod(lambda cls: tmp_path))
 
         success = init_vault()
         assert success is True